@@ -34,6 +34,9 @@ class VideoTranscriberCLI:
         self.audio_extractor = AudioExtractor()
         self.transcriber = Transcriber()
         self.summarizer = Summarizer()
+        
+        # Argument parser, built on first use
+        self._parser = None
     
     def run(self, video_path: str, output_dir: str = "output", api_key: str = None, output_format: str = "default") -> dict:
         """
@@ -152,6 +155,17 @@ class VideoTranscriberCLI:
     
     def parse_arguments(self):
         """Parse command line arguments."""
+        if self._parser is None:
+            self._parser = self._build_parser()
+        return self._parser.parse_args()
+    
+    def _build_parser(self) -> argparse.ArgumentParser:
+        """
+        Build the command line argument parser.
+        
+        Returns:
+            Configured ArgumentParser for the CLI
+        """
         parser = argparse.ArgumentParser(
             description="Convert MP4 videos to text transcriptions with AI-generated summaries",
             formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -200,7 +214,7 @@ Examples:
             help="Output format for summary (default: default)"
         )
 
-        return parser.parse_args()
+        return parser
 
 
 def main():
@@ -3,8 +3,13 @@
 import json
 import os
 import sys
+import time
 import requests
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+from requests.adapters import HTTPAdapter
+from typing import List, Optional
+from urllib3.util.retry import Retry
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -12,6 +17,35 @@ from models.summary import Summary
 from utils.config import get_config
 
 
+class SummaryLength(IntEnum):
+    """Supported summary lengths, used as indexes into the per-length tables."""
+    SHORT = 0
+    MEDIUM = 1
+    LONG = 2
+
+
+_LENGTHS_BY_NAME = {length.name.lower(): length for length in SummaryLength}
+
+# Prompt templates indexed by SummaryLength; only the text is formatted per request
+_PROMPT_TEMPLATES = (
+    "Please summarize the following text in 1-2 concise sentences. "
+    "Focus on the key points and main ideas:\n\n{text}",
+    "Please summarize the following text in 3-5 sentences. "
+    "Focus on the key points and main ideas:\n\n{text}",
+    "Please summarize the following text in 1-2 paragraphs. "
+    "Focus on the key points and main ideas:\n\n{text}"
+)
+
+# Maximum response tokens indexed by SummaryLength
+_MAX_TOKENS = (100, 200, 400)
+
+# How long a successful API key validation is trusted before re-checking
+_VALIDATION_TTL_SECONDS = 300
+
+# Size of the HTTPS connection pool; also caps concurrent batch requests
+_POOL_MAXSIZE = 10
+
+
 class Summarizer:
     """Service for generating AI summaries using ChatGPT API."""
     
@@ -24,8 +58,76 @@ class Summarizer:
         self.api_key = api_key or get_config().get_chatgpt_api_key()
         self.api_url = "https://api.openai.com/v1/chat/completions"
         self.model = "gpt-3.5-turbo"
-        self.summary_length = "medium"  # short, medium, long
+        self._length = SummaryLength.MEDIUM
         self.output_format = "default"  # default, cmu-bme-seminar
+        self.request_timeout = 30  # seconds, for summary requests
+        self.validation_timeout = 10  # seconds, for API key validation
+        self._session = self._create_session()
+        self._validation_cache = {}  # (api_key, model) -> time of last successful validation
+        
+        # Headers for the instance API key are built once and reused per request
+        self._default_headers_key = self.api_key
+        self._default_headers = self._build_headers(self.api_key) if self.api_key else None
+    
+    def _create_session(self) -> requests.Session:
+        """Create an HTTP session that keeps connections to the API alive.
+        
+        Returns:
+            Session with a pooled, retrying HTTPS adapter mounted
+        """
+        session = requests.Session()
+        # Only connection failures are retried: the request never reached the
+        # server. Chat completion POSTs are billed and not idempotent, so they
+        # are not resent after a read timeout or an error status.
+        retries = Retry(
+            total=2,
+            connect=2,
+            read=0,
+            status=0,
+            backoff_factor=0.3
+        )
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=_POOL_MAXSIZE, max_retries=retries))
+        return session
+    
+    @staticmethod
+    def _build_headers(api_key: str) -> dict:
+        """Build request headers for an API key.
+        
+        Args:
+            api_key: OpenAI API key
+            
+        Returns:
+            Headers dict for the chat completions endpoint
+        """
+        return {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+    
+    def _get_headers(self, api_key: str) -> dict:
+        """Get request headers, reusing the prebuilt ones for the instance API key.
+        
+        Args:
+            api_key: OpenAI API key used for this request
+            
+        Returns:
+            Headers dict for the chat completions endpoint
+        """
+        if api_key == self._default_headers_key and self._default_headers is not None:
+            return self._default_headers
+        return self._build_headers(api_key)
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - automatically close the HTTP session."""
+        self.close()
         
     def generate_summary(self, text: str, api_key: Optional[str] = None) -> Optional[str]:
         """Generate AI summary using ChatGPT API.
@@ -37,7 +139,8 @@ class Summarizer:
         Returns:
             Generated summary text, or None if generation failed
         """
-        if not text or not text.strip():
+        # isspace() avoids allocating a stripped copy of a long transcript
+        if not text or text.isspace():
             return None
             
         # Use provided API key or instance API key
@@ -49,12 +152,6 @@ class Summarizer:
             # Prepare the prompt based on summary length
             prompt = self._create_summary_prompt(text)
             
-            # Make request to OpenAI API
-            headers = {
-                "Authorization": f"Bearer {key_to_use}",
-                "Content-Type": "application/json"
-            }
-            
             payload = {
                 "model": self.model,
                 "messages": [
@@ -71,11 +168,12 @@ class Summarizer:
                 "temperature": 0.3
             }
             
-            response = requests.post(
+            # Make request to OpenAI API
+            response = self._session.post(
                 self.api_url,
-                headers=headers,
+                headers=self._get_headers(key_to_use),
                 json=payload,
-                timeout=30
+                timeout=self.request_timeout
             )
             
             if response.status_code == 200:
@@ -88,14 +186,46 @@ class Summarizer:
         except (requests.RequestException, json.JSONDecodeError, KeyError, Exception):
             return None
     
+    def generate_summaries(self, texts: List[str], api_key: Optional[str] = None,
+                           max_workers: int = 8) -> List[Optional[str]]:
+        """Generate AI summaries for several texts concurrently.
+        
+        Requests share the pooled HTTP session, so at most as many run at
+        once as the connection pool can hold.
+        
+        Args:
+            texts: Texts to summarize
+            api_key: Optional API key to use for these requests
+            max_workers: Maximum number of concurrent requests
+            
+        Returns:
+            Generated summaries in the same order as texts; None for any that failed
+        """
+        if not texts:
+            return []
+        
+        workers = max(1, min(max_workers, _POOL_MAXSIZE, len(texts)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda text: self.generate_summary(text, api_key), texts))
+    
     def set_summary_length(self, length: str) -> None:
         """Set summary length preference.
         
         Args:
             length: Summary length ("short", "medium", "long")
         """
-        if length.lower() in ["short", "medium", "long"]:
-            self.summary_length = length.lower()
+        new_length = _LENGTHS_BY_NAME.get(length.lower())
+        if new_length is not None:
+            self._length = new_length
+    
+    @property
+    def summary_length(self) -> str:
+        """Current summary length name ("short", "medium" or "long")."""
+        return self._length.name.lower()
+    
+    @summary_length.setter
+    def summary_length(self, length: str) -> None:
+        self.set_summary_length(length)
     
     def set_model(self, model: str) -> None:
         """Set the OpenAI model to use.
@@ -141,18 +271,7 @@ class Summarizer:
         if self.output_format == "cmu-bme-seminar":
             return self._create_cmu_bme_prompt(text)
 
-        length_instructions = {
-            "short": "in 1-2 concise sentences",
-            "medium": "in 3-5 sentences",
-            "long": "in 1-2 paragraphs"
-        }
-
-        instruction = length_instructions.get(self.summary_length, "in 3-5 sentences")
-
-        return (
-            f"Please summarize the following text {instruction}. "
-            f"Focus on the key points and main ideas:\n\n{text}"
-        )
+        return _PROMPT_TEMPLATES[self._length].format(text=text)
 
     def _create_cmu_bme_prompt(self, text: str) -> str:
         """Create a CMU BME seminar summary prompt.
@@ -210,17 +329,13 @@ Here is the transcript to summarize:
         if self.output_format == "cmu-bme-seminar":
             return 1500
 
-        token_limits = {
-            "short": 100,
-            "medium": 200,
-            "long": 400
-        }
-
-        return token_limits.get(self.summary_length, 200)
+        return _MAX_TOKENS[self._length]
     
     def validate_api_key(self, api_key: Optional[str] = None) -> bool:
         """Validate that the API key works with a simple API call.
         
+        Successful validations are cached per (api_key, model) for five minutes.
+        
         Args:
             api_key: API key to validate. If None, uses instance API key.
             
@@ -231,13 +346,14 @@ Here is the transcript to summarize:
         if not key_to_use:
             return False
         
+        # Skip the API call if this key was validated recently for this model
+        cache_key = (key_to_use, self.model)
+        validated_at = self._validation_cache.get(cache_key)
+        if validated_at is not None and time.monotonic() - validated_at < _VALIDATION_TTL_SECONDS:
+            return True
+        
         try:
             # Make a simple API call to test the key
-            headers = {
-                "Authorization": f"Bearer {key_to_use}",
-                "Content-Type": "application/json"
-            }
-            
             payload = {
                 "model": self.model,
                 "messages": [
@@ -249,14 +365,17 @@ Here is the transcript to summarize:
                 "max_tokens": 5
             }
             
-            response = requests.post(
+            response = self._session.post(
                 self.api_url,
-                headers=headers,
+                headers=self._get_headers(key_to_use),
                 json=payload,
-                timeout=10
+                timeout=self.validation_timeout
             )
             
-            return response.status_code == 200
+            if response.status_code == 200:
+                self._validation_cache[cache_key] = time.monotonic()
+                return True
+            return False
             
         except (requests.RequestException, Exception):
             return False
\ No newline at end of file
@@ -27,6 +27,9 @@ class Transcriber:
     supporting multiple languages and audio formats.
     """
     
+    # Audio formats accepted by Whisper (decoded via ffmpeg)
+    SUPPORTED_FORMATS = ('.wav', '.mp3', '.flac', '.m4a', '.ogg', '.opus', '.aac', '.aiff', '.wma')
+    
     def __init__(self, model_name: str = "turbo", language: str = None):
         """
         Initialize the Transcriber service.
@@ -185,7 +188,7 @@ class Transcriber:
         Returns:
             List of supported file extensions (Whisper supports many formats)
         """
-        return ['.wav', '.mp3', '.flac', '.m4a', '.ogg', '.opus', '.aac', '.aiff', '.wma']
+        return list(self.SUPPORTED_FORMATS)
     
     def get_current_language(self) -> str:
         """
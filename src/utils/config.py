@@ -1,7 +1,9 @@
 """Configuration management for the video transcriber application."""
 
 import os
-from typing import Optional
+import threading
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 from pathlib import Path
 
 try:
@@ -11,19 +13,57 @@ except ImportError:
     DOTENV_AVAILABLE = False
 
 
+@lru_cache(maxsize=32)
+def _parse_config_file(path: str, mtime_ns: int, size: int) -> Tuple[Tuple[str, str], ...]:
+    """Parse key=value entries from a configuration file.
+    
+    Results are cached per path, modification time and size, so an unchanged
+    file is only parsed once. On filesystems with coarse timestamps, an outside
+    rewrite that keeps the same size within one timestamp tick can return stale
+    entries. Config._save_config clears the cache after its own writes.
+    
+    Args:
+        path: Path to the configuration file
+        mtime_ns: File modification time in nanoseconds (cache key only)
+        size: File size in bytes (cache key only)
+        
+    Returns:
+        Tuple of (key, value) pairs in file order
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    
+    # Skip comments and lines without '='; split on the first '=' only
+    return tuple(
+        (key.strip(), value.strip())
+        for key, sep, value in (line.strip().partition('=') for line in lines)
+        if sep and not key.startswith('#')
+    )
+
+
 class Config:
     """Configuration manager for application settings."""
     
-    def __init__(self, config_file: Optional[str] = None):
+    def __init__(self, config_file: Optional[str] = None,
+                 initial: Optional[Dict[str, str]] = None):
         """Initialize configuration manager.
         
         Args:
             config_file: Optional path to configuration file
+            initial: Optional values applied over the config file contents.
+                Without a config_file the configuration is kept in memory only:
+                no config or .env file is read and nothing is written to disk.
+                Variables already set in the process environment still supply
+                defaults for keys missing from initial.
         """
-        self.config_file = config_file or self._get_default_config_path()
+        if initial is not None and config_file is None:
+            self.config_file = None
+        else:
+            self.config_file = config_file or self._get_default_config_path()
         self._config = {}
-        self._load_dotenv()
-        self._load_config()
+        if self.config_file is not None:
+            self._load_dotenv()
+        self._load_config(initial)
     
     def _get_default_config_path(self) -> str:
         """Get default configuration file path."""
@@ -53,8 +93,12 @@ class Config:
                 load_dotenv(dotenv_path, override=False)  # Don't override existing env vars
                 break
     
-    def _load_config(self) -> None:
-        """Load configuration from file and environment variables."""
+    def _load_config(self, initial: Optional[Dict[str, str]] = None) -> None:
+        """Load configuration from file and environment variables.
+        
+        Args:
+            initial: Optional values applied over the config file contents
+        """
         # Load from environment variables first
         self._config = {
             'chatgpt_api_key': os.getenv('CHATGPT_API_KEY') or os.getenv('OPENAI_API_KEY'),
@@ -63,17 +107,18 @@ class Config:
         }
         
         # Load from config file if it exists
-        if os.path.exists(self.config_file):
+        if self.config_file is not None and os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#'):
-                            if '=' in line:
-                                key, value = line.split('=', 1)
-                                self._config[key.strip()] = value.strip()
+                stat = os.stat(self.config_file)
+                self._config.update(
+                    _parse_config_file(self.config_file, stat.st_mtime_ns, stat.st_size)
+                )
             except (OSError, IOError):
                 pass  # Ignore file read errors
+        
+        # Explicit initial values take precedence over the file
+        if initial is not None:
+            self._config.update(initial)
     
     def get_chatgpt_api_key(self) -> Optional[str]:
         """Get ChatGPT API key from configuration.
@@ -150,20 +195,30 @@ class Config:
     
     def _save_config(self) -> None:
         """Save configuration to file."""
+        if self.config_file is None:
+            return  # In-memory configuration
+        
         try:
             # Ensure config directory exists
             config_path = Path(self.config_file)
             config_path.parent.mkdir(parents=True, exist_ok=True)
             
+            # Build the whole file first so it goes out in a single write
+            lines = [
+                "# Video Transcriber Configuration\n",
+                "# Format: key=value\n\n",
+            ]
+            lines.extend(
+                f"{key}={value}\n" for key, value in self._config.items() if value is not None
+            )
+            
             with open(self.config_file, 'w', encoding='utf-8') as f:
-                f.write("# Video Transcriber Configuration\n")
-                f.write("# Format: key=value\n\n")
-                
-                for key, value in self._config.items():
-                    if value is not None:
-                        f.write(f"{key}={value}\n")
+                f.write(''.join(lines))
         except (OSError, IOError):
             pass  # Ignore file write errors
+        finally:
+            # Never serve entries cached from before this write
+            _parse_config_file.cache_clear()
     
     def validate_api_key(self) -> bool:
         """Validate that ChatGPT API key is available and has correct format.
@@ -181,6 +236,7 @@ class Config:
 
 # Global config instance for easy access
 _config_instance = None
+_config_lock = threading.Lock()
 
 
 def get_config() -> Config:
@@ -191,5 +247,8 @@ def get_config() -> Config:
     """
     global _config_instance
     if _config_instance is None:
-        _config_instance = Config()
+        # Double-checked so concurrent first calls share a single instance
+        with _config_lock:
+            if _config_instance is None:
+                _config_instance = Config()
     return _config_instance
\ No newline at end of file
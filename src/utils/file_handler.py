@@ -1,6 +1,9 @@
 """File handler utility for consistent file I/O operations."""
 
+import errno
+import fnmatch
 import os
+import re
 import shutil
 from typing import Optional, List
 from pathlib import Path
@@ -129,6 +132,16 @@ class FileHandler:
             if dest_dir and not FileHandler.ensure_directory_exists(dest_dir):
                 return False
             
+            # A same-filesystem move is a single atomic rename; shutil.move is
+            # kept for moves into a directory and across filesystems
+            if not os.path.isdir(destination_path):
+                try:
+                    os.replace(source_path, destination_path)
+                    return True
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+            
             shutil.move(source_path, destination_path)
             return True
         except (OSError, IOError, shutil.Error):
@@ -198,14 +211,26 @@ class FileHandler:
             pattern: Glob pattern to match files (default: "*")
             
         Returns:
-            List of file paths matching the pattern
+            Sorted list of file paths matching the pattern
         """
         try:
             directory = Path(directory_path)
-            if not directory.exists() or not directory.is_dir():
-                return []
             
-            return [str(path) for path in directory.glob(pattern) if path.is_file()]
+            # Patterns within a single directory are matched against one scandir
+            # listing; DirEntry caches the file type, so no extra stat per entry.
+            # The pattern is compiled once rather than looked up per name.
+            if '**' not in pattern and '/' not in pattern and os.sep not in pattern:
+                match = re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+                with os.scandir(directory_path) as entries:
+                    paths = [directory / entry.name for entry in entries
+                             if match(os.path.normcase(entry.name)) and entry.is_file()]
+            else:
+                if not directory.exists() or not directory.is_dir():
+                    return []
+                paths = [path for path in directory.glob(pattern) if path.is_file()]
+            
+            # Both branches join through Path, so results look the same either way
+            return sorted(str(path) for path in paths)
         except (OSError, ValueError):
             return []
     
@@ -241,7 +266,7 @@ class FileHandler:
             base_path: Base file path
             
         Returns:
-            Unique file path
+            Unique file path using the lowest free number
         """
         if not os.path.exists(base_path):
             return base_path
@@ -251,13 +276,31 @@ class FileHandler:
         suffix = path.suffix
         parent = path.parent
         
+        def candidate(counter: int) -> str:
+            return str(parent / f"{stem}_{counter}{suffix}")
+        
+        # Collect the numbers already taken from one directory listing rather
+        # than checking each numbered name in turn
+        prefix = f"{stem}_"
+        taken = set()
+        try:
+            with os.scandir(parent) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if (name.startswith(prefix) and name.endswith(suffix)
+                            and len(name) > len(prefix) + len(suffix)):
+                        number = name[len(prefix):len(name) - len(suffix)]
+                        if number.isdigit() and str(int(number)) == number:
+                            taken.add(int(number))
+        except OSError:
+            pass  # Fall back to checking every candidate
+        
+        # Still confirm with os.path.exists, which also sees names the
+        # listing spelled differently (e.g. on case-insensitive filesystems)
         counter = 1
-        while True:
-            new_name = f"{stem}_{counter}{suffix}"
-            new_path = parent / new_name
-            if not new_path.exists():
-                return str(new_path)
+        while counter in taken or os.path.exists(candidate(counter)):
             counter += 1
+        return candidate(counter)
     
     @staticmethod
     def is_file_writable(file_path: str) -> bool:
@@ -0,0 +1,29 @@
+"""Shared pytest configuration for the video transcriber test suite."""
+
+import os
+import sys
+import tempfile
+import types
+import unittest.mock
+
+
+# Stub whisper so the transcriber can be imported without the model weights;
+# tests that load a model patch src.services.transcriber.whisper themselves
+mock_whisper = types.ModuleType('whisper')
+mock_whisper.available_models = lambda: ['tiny', 'base', 'small', 'medium', 'large', 'turbo']
+mock_whisper.load_model = unittest.mock.MagicMock()
+sys.modules.setdefault('whisper', mock_whisper)
+
+# Put src on the path once so modules like main import the same way the CLI does
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+def ram_backed_temp_dir() -> tempfile.TemporaryDirectory:
+    """Create a temporary directory, under /dev/shm where available.
+    
+    Returns:
+        TemporaryDirectory on a RAM-backed filesystem on Linux, or in the
+        default temp location elsewhere
+    """
+    base_dir = '/dev/shm' if os.path.isdir('/dev/shm') else None
+    return tempfile.TemporaryDirectory(dir=base_dir)
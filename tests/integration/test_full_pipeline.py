@@ -52,7 +52,7 @@ class TestFullPipeline(unittest.TestCase):
     @patch('src.services.audio_extractor.AudioExtractor.extract_audio')
     @patch('src.services.audio_extractor.AudioExtractor.cleanup_temp_files')
     @patch('src.services.transcriber.Transcriber.transcribe_to_model')
-    @patch('src.services.summarizer.requests.post')
+    @patch('src.services.summarizer.requests.Session.post')
     def test_full_pipeline_with_summary(self, mock_requests, mock_transcribe, mock_cleanup, mock_extract):
         """Test complete pipeline including summary generation."""
         # Setup mocks
@@ -245,7 +245,7 @@ class TestFullPipeline(unittest.TestCase):
     @patch('src.services.audio_extractor.AudioExtractor.extract_audio')
     @patch('src.services.audio_extractor.AudioExtractor.cleanup_temp_files')
     @patch('src.services.transcriber.Transcriber.transcribe_to_model')
-    @patch('src.services.summarizer.requests.post')
+    @patch('src.services.summarizer.requests.Session.post')
     def test_pipeline_summary_generation_failure(self, mock_requests, mock_transcribe, mock_cleanup, mock_extract):
         """Test pipeline behavior when summary generation fails but transcription succeeds."""
         # Setup mocks
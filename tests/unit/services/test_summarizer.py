@@ -1,6 +1,7 @@
 """Unit tests for Summarizer service."""
 
 import json
+import threading
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 
@@ -8,17 +9,54 @@ from src.services.summarizer import Summarizer
 from src.models.summary import Summary
 
 
+@patch('src.services.summarizer.requests.Session.post')
 class TestSummarizer(unittest.TestCase):
     """Test cases for Summarizer service."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up immutable fixtures shared by all tests."""
+        cls.api_key = "sk-test-api-key-123"
+        cls.test_text = "This is a long text that needs to be summarized for testing purposes."
+        cls.test_summary = "This is a summary of the text."
+        cls._base_summarizer = Summarizer(api_key=cls.api_key)
+        
+        # Canonical API responses reused across tests
+        cls.SUCCESS_RESPONSE = Mock(status_code=200)
+        cls.SUCCESS_RESPONSE.json.return_value = {
+            "choices": [{"message": {"content": cls.test_summary}}]
+        }
+        cls.UNAUTHORIZED_RESPONSE = Mock(status_code=401)
+        cls.MALFORMED_RESPONSE = Mock(status_code=200)
+        cls.MALFORMED_RESPONSE.json.return_value = {"error": "malformed response"}
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.api_key = "sk-test-api-key-123"
-        self.summarizer = Summarizer(api_key=self.api_key)
-        self.test_text = "This is a long text that needs to be summarized for testing purposes."
-        self.test_summary = "This is a summary of the text."
+        # Read-only tests share one instance; tests that mutate settings
+        # construct their own Summarizer.
+        self.summarizer = self._base_summarizer
+        self.summarizer._validation_cache.clear()
     
-    def test_init_with_api_key(self):
+    def _record_post(self, mock_post, response=None):
+        """Capture the keyword arguments of the next API call into a plain dict.
+        
+        Args:
+            mock_post: Patched Session.post mock
+            response: Response to return (default: SUCCESS_RESPONSE)
+            
+        Returns:
+            Dict that is filled with the request kwargs when the call is made
+        """
+        captured = {}
+        
+        def record(*args, **kwargs):
+            captured.update(kwargs)
+            return response or self.SUCCESS_RESPONSE
+        
+        mock_post.side_effect = record
+        return captured
+    
+    def test_init_with_api_key(self, mock_post):
         """Test Summarizer initialization with API key."""
         summarizer = Summarizer(api_key=self.api_key)
         self.assertEqual(summarizer.api_key, self.api_key)
@@ -26,7 +64,7 @@ class TestSummarizer(unittest.TestCase):
         self.assertEqual(summarizer.summary_length, "medium")
     
     @patch('src.services.summarizer.get_config')
-    def test_init_without_api_key_uses_config(self, mock_get_config):
+    def test_init_without_api_key_uses_config(self, mock_get_config, mock_post):
         """Test Summarizer initialization without API key uses config."""
         mock_config = Mock()
         mock_config.get_chatgpt_api_key.return_value = "sk-config-key"
@@ -35,22 +73,9 @@ class TestSummarizer(unittest.TestCase):
         summarizer = Summarizer()
         self.assertEqual(summarizer.api_key, "sk-config-key")
     
-    @patch('src.services.summarizer.requests.post')
     def test_generate_summary_success(self, mock_post):
         """Test successful summary generation."""
-        # Mock successful API response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "choices": [
-                {
-                    "message": {
-                        "content": self.test_summary
-                    }
-                }
-            ]
-        }
-        mock_post.return_value = mock_response
+        captured = self._record_post(mock_post)
         
         result = self.summarizer.generate_summary(self.test_text)
         
@@ -58,23 +83,54 @@ class TestSummarizer(unittest.TestCase):
         mock_post.assert_called_once()
         
         # Verify the API call was made with correct parameters
-        call_args = mock_post.call_args
-        self.assertIn("headers", call_args.kwargs)
-        self.assertIn("json", call_args.kwargs)
-        self.assertEqual(call_args.kwargs["headers"]["Authorization"], f"Bearer {self.api_key}")
+        self.assertIn("headers", captured)
+        self.assertIn("json", captured)
+        self.assertEqual(captured["headers"]["Authorization"], f"Bearer {self.api_key}")
+    
+    def test_generate_summary_reuses_default_headers(self, mock_post):
+        """Test that headers for the instance API key are built once and reused."""
+        mock_post.return_value = self.SUCCESS_RESPONSE
+        
+        self.summarizer.generate_summary(self.test_text)
+        first_headers = mock_post.call_args.kwargs["headers"]
+        self.summarizer.generate_summary(self.test_text)
+        
+        self.assertIs(mock_post.call_args.kwargs["headers"], first_headers)
+    
+    def test_generate_summaries_runs_concurrently(self, mock_post):
+        """Test that batch summaries are requested in parallel and keep input order."""
+        texts = ["first text", "second text", "third text"]
+        barrier = threading.Barrier(len(texts), timeout=5)
+        
+        def post(*args, **kwargs):
+            # Only returns once all requests are in flight at the same time
+            barrier.wait()
+            return self.SUCCESS_RESPONSE
+        
+        mock_post.side_effect = post
+        
+        results = self.summarizer.generate_summaries(texts)
+        
+        self.assertEqual(results, [self.test_summary] * len(texts))
+        self.assertEqual(mock_post.call_count, len(texts))
+    
+    def test_generate_summaries_preserves_failures(self, mock_post):
+        """Test that failed or empty inputs yield None in their position."""
+        mock_post.return_value = self.SUCCESS_RESPONSE
+        
+        results = self.summarizer.generate_summaries([self.test_text, "   "])
+        
+        self.assertEqual(results, [self.test_summary, None])
+        self.assertEqual(self.summarizer.generate_summaries([]), [])
     
-    @patch('src.services.summarizer.requests.post')
     def test_generate_summary_api_error(self, mock_post):
         """Test summary generation with API error."""
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_post.return_value = mock_response
+        mock_post.return_value = self.UNAUTHORIZED_RESPONSE
         
         result = self.summarizer.generate_summary(self.test_text)
         
         self.assertIsNone(result)
     
-    @patch('src.services.summarizer.requests.post')
     def test_generate_summary_network_error(self, mock_post):
         """Test summary generation with network error."""
         mock_post.side_effect = Exception("Network error")
@@ -83,7 +139,26 @@ class TestSummarizer(unittest.TestCase):
         
         self.assertIsNone(result)
     
-    def test_generate_summary_empty_text(self):
+    def test_session_mounts_pooled_https_adapter(self, mock_post):
+        """Test that the HTTP session pools connections and only retries failed connects."""
+        adapter = self.summarizer._session.get_adapter(self.summarizer.api_url)
+        retries = adapter.max_retries
+        
+        self.assertEqual(adapter._pool_maxsize, 10)
+        self.assertEqual(retries.connect, 2)
+        self.assertEqual(retries.read, 0)
+        self.assertFalse(retries.is_retry('POST', 429))
+        self.assertFalse(retries.is_retry('POST', 503))
+    
+    @patch('src.services.summarizer.requests.Session.close')
+    def test_context_manager_closes_session(self, mock_close, mock_post):
+        """Test that leaving the context manager closes the session."""
+        with Summarizer(api_key=self.api_key) as summarizer:
+            self.assertIsInstance(summarizer, Summarizer)
+        
+        mock_close.assert_called_once()
+    
+    def test_generate_summary_empty_text(self, mock_post):
         """Test summary generation with empty text."""
         result = self.summarizer.generate_summary("")
         self.assertIsNone(result)
@@ -91,23 +166,17 @@ class TestSummarizer(unittest.TestCase):
         result = self.summarizer.generate_summary("   ")
         self.assertIsNone(result)
     
-    def test_generate_summary_no_api_key(self):
+    def test_generate_summary_no_api_key(self, mock_post):
         """Test summary generation without API key."""
         summarizer = Summarizer(api_key=None)
         result = summarizer.generate_summary(self.test_text)
         
         self.assertIsNone(result)
     
-    @patch('src.services.summarizer.requests.post')
     def test_generate_summary_with_custom_api_key(self, mock_post):
         """Test summary generation with custom API key parameter."""
         custom_key = "sk-custom-key"
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "choices": [{"message": {"content": self.test_summary}}]
-        }
-        mock_post.return_value = mock_response
+        mock_post.return_value = self.SUCCESS_RESPONSE
         
         result = self.summarizer.generate_summary(self.test_text, api_key=custom_key)
         
@@ -117,42 +186,50 @@ class TestSummarizer(unittest.TestCase):
         call_args = mock_post.call_args
         self.assertEqual(call_args.kwargs["headers"]["Authorization"], f"Bearer {custom_key}")
     
-    @patch('src.services.summarizer.requests.post')
     def test_generate_summary_malformed_response(self, mock_post):
         """Test summary generation with malformed API response."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"error": "malformed response"}
-        mock_post.return_value = mock_response
+        mock_post.return_value = self.MALFORMED_RESPONSE
         
         result = self.summarizer.generate_summary(self.test_text)
         
         self.assertIsNone(result)
     
-    def test_set_summary_length_valid(self):
+    def test_set_summary_length_valid(self, mock_post):
         """Test setting valid summary lengths."""
-        self.summarizer.set_summary_length("short")
-        self.assertEqual(self.summarizer.summary_length, "short")
+        summarizer = Summarizer(api_key=self.api_key)
+        summarizer.set_summary_length("short")
+        self.assertEqual(summarizer.summary_length, "short")
         
-        self.summarizer.set_summary_length("LONG")
-        self.assertEqual(self.summarizer.summary_length, "long")
+        summarizer.set_summary_length("LONG")
+        self.assertEqual(summarizer.summary_length, "long")
         
-        self.summarizer.set_summary_length("Medium")
-        self.assertEqual(self.summarizer.summary_length, "medium")
+        summarizer.set_summary_length("Medium")
+        self.assertEqual(summarizer.summary_length, "medium")
     
-    def test_set_summary_length_invalid(self):
+    def test_set_summary_length_invalid(self, mock_post):
         """Test setting invalid summary length doesn't change value."""
-        original_length = self.summarizer.summary_length
-        self.summarizer.set_summary_length("invalid")
-        self.assertEqual(self.summarizer.summary_length, original_length)
+        summarizer = Summarizer(api_key=self.api_key)
+        original_length = summarizer.summary_length
+        summarizer.set_summary_length("invalid")
+        self.assertEqual(summarizer.summary_length, original_length)
     
-    def test_set_model(self):
+    def test_assign_summary_length_attribute(self, mock_post):
+        """Test that assigning summary_length directly still updates the length."""
+        summarizer = Summarizer(api_key=self.api_key)
+        summarizer.summary_length = "short"
+        self.assertEqual(summarizer.summary_length, "short")
+        
+        summarizer.summary_length = "invalid"
+        self.assertEqual(summarizer.summary_length, "short")
+    
+    def test_set_model(self, mock_post):
         """Test setting the model."""
+        summarizer = Summarizer(api_key=self.api_key)
         new_model = "gpt-4"
-        self.summarizer.set_model(new_model)
-        self.assertEqual(self.summarizer.model, new_model)
+        summarizer.set_model(new_model)
+        self.assertEqual(summarizer.model, new_model)
     
-    def test_create_summary_object(self):
+    def test_create_summary_object(self, mock_post):
         """Test creating Summary object."""
         original_text = "This is the original text that was summarized."
         summary_text = "This is the summary."
@@ -163,65 +240,68 @@ class TestSummarizer(unittest.TestCase):
         self.assertEqual(summary.text, summary_text)
         self.assertEqual(summary.original_length, len(original_text))
     
-    def test_create_summary_prompt_short(self):
-        """Test creating summary prompt for short length."""
-        self.summarizer.set_summary_length("short")
-        prompt = self.summarizer._create_summary_prompt(self.test_text)
-        
-        self.assertIn("1-2 concise sentences", prompt)
-        self.assertIn(self.test_text, prompt)
-    
-    def test_create_summary_prompt_medium(self):
-        """Test creating summary prompt for medium length."""
-        self.summarizer.set_summary_length("medium")
-        prompt = self.summarizer._create_summary_prompt(self.test_text)
-        
-        self.assertIn("3-5 sentences", prompt)
-        self.assertIn(self.test_text, prompt)
-    
-    def test_create_summary_prompt_long(self):
-        """Test creating summary prompt for long length."""
-        self.summarizer.set_summary_length("long")
-        prompt = self.summarizer._create_summary_prompt(self.test_text)
-        
-        self.assertIn("1-2 paragraphs", prompt)
-        self.assertIn(self.test_text, prompt)
+    def test_create_summary_prompts(self, mock_post):
+        """Test creating summary prompts for each length."""
+        summarizer = Summarizer(api_key=self.api_key)
+        cases = [
+            ("short", "1-2 concise sentences"),
+            ("medium", "3-5 sentences"),
+            ("long", "1-2 paragraphs")
+        ]
+        
+        for length, marker in cases:
+            with self.subTest(length=length):
+                summarizer.set_summary_length(length)
+                prompt = summarizer._create_summary_prompt(self.test_text)
+                
+                self.assertIn(marker, prompt)
+                self.assertIn(self.test_text, prompt)
     
-    def test_get_max_tokens_for_length(self):
+    def test_get_max_tokens_for_length(self, mock_post):
         """Test getting max tokens for different lengths."""
-        self.summarizer.set_summary_length("short")
-        self.assertEqual(self.summarizer._get_max_tokens_for_length(), 100)
-        
-        self.summarizer.set_summary_length("medium")
-        self.assertEqual(self.summarizer._get_max_tokens_for_length(), 200)
+        summarizer = Summarizer(api_key=self.api_key)
+        cases = [("short", 100), ("medium", 200), ("long", 400)]
         
-        self.summarizer.set_summary_length("long")
-        self.assertEqual(self.summarizer._get_max_tokens_for_length(), 400)
+        for length, max_tokens in cases:
+            with self.subTest(length=length):
+                summarizer.set_summary_length(length)
+                self.assertEqual(summarizer._get_max_tokens_for_length(), max_tokens)
     
-    @patch('src.services.summarizer.requests.post')
     def test_validate_api_key_valid(self, mock_post):
         """Test API key validation with valid key."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_post.return_value = mock_response
+        mock_post.return_value = self.SUCCESS_RESPONSE
         
         result = self.summarizer.validate_api_key()
         
         self.assertTrue(result)
         mock_post.assert_called_once()
     
-    @patch('src.services.summarizer.requests.post')
+    def test_validate_api_key_cached(self, mock_post):
+        """Test that a successful validation is reused for the same key and model."""
+        mock_post.return_value = self.SUCCESS_RESPONSE
+        
+        self.assertTrue(self.summarizer.validate_api_key())
+        self.assertTrue(self.summarizer.validate_api_key())
+        mock_post.assert_called_once()
+    
+    @patch('src.services.summarizer.time.monotonic')
+    def test_validate_api_key_cache_expires(self, mock_monotonic, mock_post):
+        """Test that a cached validation is re-checked after the TTL."""
+        mock_post.return_value = self.SUCCESS_RESPONSE
+        mock_monotonic.side_effect = [1000.0, 1000.0 + 301, 1000.0 + 301]
+        
+        self.assertTrue(self.summarizer.validate_api_key())
+        self.assertTrue(self.summarizer.validate_api_key())
+        self.assertEqual(mock_post.call_count, 2)
+    
     def test_validate_api_key_invalid(self, mock_post):
         """Test API key validation with invalid key."""
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_post.return_value = mock_response
+        mock_post.return_value = self.UNAUTHORIZED_RESPONSE
         
         result = self.summarizer.validate_api_key()
         
         self.assertFalse(result)
     
-    @patch('src.services.summarizer.requests.post')
     def test_validate_api_key_network_error(self, mock_post):
         """Test API key validation with network error."""
         mock_post.side_effect = Exception("Network error")
@@ -230,20 +310,17 @@ class TestSummarizer(unittest.TestCase):
         
         self.assertFalse(result)
     
-    def test_validate_api_key_no_key(self):
+    def test_validate_api_key_no_key(self, mock_post):
         """Test API key validation without key."""
         summarizer = Summarizer(api_key=None)
         result = summarizer.validate_api_key()
         
         self.assertFalse(result)
     
-    @patch('src.services.summarizer.requests.post')
     def test_validate_api_key_custom_key(self, mock_post):
         """Test API key validation with custom key parameter."""
         custom_key = "sk-custom-key"
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_post.return_value = mock_response
+        mock_post.return_value = self.SUCCESS_RESPONSE
         
         result = self.summarizer.validate_api_key(api_key=custom_key)
         
@@ -253,42 +330,18 @@ class TestSummarizer(unittest.TestCase):
         call_args = mock_post.call_args
         self.assertEqual(call_args.kwargs["headers"]["Authorization"], f"Bearer {custom_key}")
     
-    @patch('src.services.summarizer.requests.post')
-    def test_api_request_timeout(self, mock_post):
-        """Test API request with timeout settings."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "choices": [{"message": {"content": self.test_summary}}]
-        }
-        mock_post.return_value = mock_response
-        
-        result = self.summarizer.generate_summary(self.test_text)
-        
-        self.assertEqual(result, self.test_summary)
-        
-        # Verify timeout was set
-        call_args = mock_post.call_args
-        self.assertEqual(call_args.kwargs["timeout"], 30)
-    
-    @patch('src.services.summarizer.requests.post')
     def test_api_request_payload_structure(self, mock_post):
-        """Test that API request payload has correct structure."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "choices": [{"message": {"content": self.test_summary}}]
-        }
-        mock_post.return_value = mock_response
+        """Test that API request payload and timeout are set correctly."""
+        summarizer = Summarizer(api_key=self.api_key)
+        captured = self._record_post(mock_post)
         
-        self.summarizer.set_summary_length("short")
-        result = self.summarizer.generate_summary(self.test_text)
+        summarizer.set_summary_length("short")
+        result = summarizer.generate_summary(self.test_text)
         
         self.assertEqual(result, self.test_summary)
         
         # Verify payload structure
-        call_args = mock_post.call_args
-        payload = call_args.kwargs["json"]
+        payload = captured["json"]
         
         self.assertEqual(payload["model"], "gpt-3.5-turbo")
         self.assertEqual(len(payload["messages"]), 2)
@@ -296,6 +349,9 @@ class TestSummarizer(unittest.TestCase):
         self.assertEqual(payload["messages"][1]["role"], "user")
         self.assertEqual(payload["max_tokens"], 100)  # short length
         self.assertEqual(payload["temperature"], 0.3)
+        
+        # Verify timeout was set
+        self.assertEqual(captured["timeout"], 30)
 
 
 if __name__ == '__main__':
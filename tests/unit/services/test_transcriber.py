@@ -3,44 +3,49 @@ Unit tests for the Transcriber service.
 """
 
 import unittest
-import tempfile
-import os
-import sys
-from unittest.mock import patch, MagicMock, mock_open
-
-# Mock whisper module for testing
-mock_whisper = MagicMock()
-mock_whisper.available_models = MagicMock(return_value=['tiny', 'base', 'small', 'medium', 'large', 'turbo'])
-mock_whisper.load_model = MagicMock()
-sys.modules['whisper'] = mock_whisper
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock, call
 
 from src.services.transcriber import Transcriber, TranscriberError
 from src.models.transcription import Transcription
 from src.utils.validators import ValidationError
 
+assert issubclass(TranscriberError, Exception), "TranscriberError must subclass Exception"
+
+# Whisper model returned by the mocked whisper.load_model, shared by all tests;
+# only transcribe is ever called on it, so just that method is a mock
+_MOCK_MODEL = SimpleNamespace(transcribe=MagicMock())
+
 
 class TestTranscriber(unittest.TestCase):
     """Test cases for the Transcriber service."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by the whole test class."""
+        # Audio paths are never opened: tests patch validate_file_exists and the
+        # Whisper model, so no dummy files need to be written to disk.
+        cls.valid_wav_file = "/fake/audio/test_audio.wav"
+        cls.valid_flac_file = "/fake/audio/test_audio.flac"
+        cls.valid_mp3_file = "/fake/audio/test_audio.mp3"
+        
+        # Shared transcriber with the model already loaded; tests that change
+        # settings or exercise model loading construct their own Transcriber
+        cls._shared_transcriber = Transcriber()
+        cls._shared_transcriber.model = _MOCK_MODEL
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.transcriber = Transcriber()
-        self.temp_dir = tempfile.mkdtemp()
-        
-        # Create test audio file paths
-        self.valid_wav_file = os.path.join(self.temp_dir, "test_audio.wav")
-        self.valid_flac_file = os.path.join(self.temp_dir, "test_audio.flac")
-        self.valid_mp3_file = os.path.join(self.temp_dir, "test_audio.mp3")
+        self.transcriber = self._shared_transcriber
         
-        # Create dummy files
-        for file_path in [self.valid_wav_file, self.valid_flac_file, self.valid_mp3_file]:
-            with open(file_path, 'wb') as f:
-                f.write(b"dummy audio content for testing")
+        # Reset the shared model mock instead of building a new one per test
+        _MOCK_MODEL.transcribe.reset_mock(return_value=True, side_effect=True)
+        _MOCK_MODEL.transcribe.return_value = {'text': 'Hello world', 'language': 'en'}
+        self.mock_model = _MOCK_MODEL
     
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
+    def _assert_single_call(self, mock, *args, **kwargs):
+        """Assert that a mock was called exactly once with the given arguments."""
+        self.assertEqual(mock.call_args_list, [call(*args, **kwargs)])
     
     def test_initialization(self):
         """Test Transcriber initialization."""
@@ -57,24 +62,21 @@ class TestTranscriber(unittest.TestCase):
     
     def test_set_language(self):
         """Test setting language."""
-        # Test valid language
-        self.transcriber.set_language("fr")
-        self.assertEqual(self.transcriber.language, "fr")
-        
-        # Test None language (auto-detection)
-        self.transcriber.set_language(None)
-        self.assertIsNone(self.transcriber.language)
+        transcriber = Transcriber()
         
-        # Test empty string (should work as None)
-        self.transcriber.set_language("")
-        self.assertEqual(self.transcriber.language, "")
+        # Valid language, None (auto-detection) and empty string are all stored as-is
+        for language in ("fr", None, ""):
+            with self.subTest(language=language):
+                transcriber.set_language(language)
+                self.assertEqual(transcriber.language, language)
     
     def test_get_current_language(self):
         """Test getting current language."""
-        self.assertIsNone(self.transcriber.get_current_language())  # Default is None (auto-detect)
+        transcriber = Transcriber()
+        self.assertIsNone(transcriber.get_current_language())  # Default is None (auto-detect)
         
-        self.transcriber.set_language("de")
-        self.assertEqual(self.transcriber.get_current_language(), "de")
+        transcriber.set_language("de")
+        self.assertEqual(transcriber.get_current_language(), "de")
     
     def test_get_supported_formats(self):
         """Test getting supported audio formats."""
@@ -82,129 +84,119 @@ class TestTranscriber(unittest.TestCase):
         expected_formats = ['.wav', '.mp3', '.flac', '.m4a', '.ogg', '.opus', '.aac', '.aiff', '.wma']
         
         self.assertEqual(formats, expected_formats)
-        self.assertIsInstance(formats, list)
+        
+        # Callers get their own list; the class constant is left untouched
+        formats.append('.xyz')
+        self.assertNotIn('.xyz', self.transcriber.get_supported_formats())
     
     def test_set_model(self):
         """Test setting Whisper model."""
+        transcriber = Transcriber()
         # Test valid model
-        self.transcriber.set_model("base")
-        self.assertEqual(self.transcriber.model_name, "base")
-        self.assertIsNone(self.transcriber.model)  # Should reset model
+        transcriber.set_model("base")
+        self.assertEqual(transcriber.model_name, "base")
+        self.assertIsNone(transcriber.model)  # Should reset model
         
         # Test invalid model
         with self.assertRaises(TranscriberError) as context:
-            self.transcriber.set_model("invalid_model")
+            transcriber.set_model("invalid_model")
         self.assertIn("Invalid model name", str(context.exception))
     
     @patch('src.services.transcriber.validate_file_exists')
-    def test_transcribe_validation_error(self, mock_validate):
-        """Test transcribe method with file validation error."""
-        mock_validate.side_effect = ValidationError("File does not exist")
-        
-        with self.assertRaises(TranscriberError) as context:
-            self.transcriber.transcribe(self.valid_wav_file)
-        
-        self.assertIn("Audio file validation failed", str(context.exception))
-        self.assertIn("File does not exist", str(context.exception))
+    def test_transcribe_error_paths(self, mock_validate):
+        """Test that transcription failures are wrapped in TranscriberError."""
+        # (case, validation error, Whisper error, transcribed text, expected messages)
+        cases = (
+            ("validation", ValidationError("File does not exist"), None, "Hello world",
+             ("Audio file validation failed", "File does not exist")),
+            ("whisper", None, Exception("Whisper processing error"), "Hello world",
+             ("Failed to transcribe audio", "Whisper processing error")),
+            ("no speech", None, None, "  ",
+             ("No speech detected in audio file",)),
+        )
+        for case, validation_error, whisper_error, text, messages in cases:
+            with self.subTest(case=case):
+                mock_validate.side_effect = validation_error
+                self.mock_model.transcribe.side_effect = whisper_error
+                self.mock_model.transcribe.return_value = {'text': text, 'language': 'en'}
+                
+                with self.assertRaises(TranscriberError) as context:
+                    self.transcriber.transcribe(self.valid_wav_file)
+                
+                for message in messages:
+                    self.assertIn(message, str(context.exception))
     
     def test_get_model_name(self):
         """Test getting model name."""
-        self.assertEqual(self.transcriber.get_model_name(), "turbo")
+        transcriber = Transcriber()
+        self.assertEqual(transcriber.get_model_name(), "turbo")
         
-        self.transcriber.set_model("base")
-        self.assertEqual(self.transcriber.get_model_name(), "base")
+        transcriber.set_model("base")
+        self.assertEqual(transcriber.get_model_name(), "base")
     
+    @patch('src.services.transcriber.whisper')
     @patch('src.services.transcriber.validate_file_exists')
-    def test_transcribe_success(self, mock_validate):
+    def test_transcribe_success(self, mock_validate, mock_whisper):
         """Test successful transcription with Whisper."""
+        mock_whisper.load_model.return_value = self.mock_model
+        transcriber = Transcriber()
         # Setup mocks
         mock_validate.return_value = None
         
-        mock_model = MagicMock()
-        mock_model.transcribe.return_value = {
-            'text': 'Hello world',
-            'language': 'en'
-        }
-        mock_whisper.load_model.return_value = mock_model
-        
         # Test transcription
-        result = self.transcriber.transcribe(self.valid_wav_file)
+        result = transcriber.transcribe(self.valid_wav_file)
         
         self.assertEqual(result, "Hello world")
-        mock_validate.assert_called_once_with(self.valid_wav_file)
-        mock_whisper.load_model.assert_called_once_with("turbo")
-        mock_model.transcribe.assert_called_once()
-    
-    @patch('src.services.transcriber.validate_file_exists')
-    def test_transcribe_no_speech_detected(self, mock_validate):
-        """Test transcription when no speech is detected."""
-        # Setup mocks
-        mock_validate.return_value = None
-        
-        mock_model = MagicMock()
-        mock_model.transcribe.return_value = {
-            'text': '  ',  # Empty/whitespace text
-            'language': 'en'
-        }
-        mock_whisper.load_model.return_value = mock_model
-        
-        # Test transcription with empty result
-        with self.assertRaises(TranscriberError) as context:
-            self.transcriber.transcribe(self.valid_wav_file)
-        
-        self.assertIn("No speech detected in audio file", str(context.exception))
+        self._assert_single_call(mock_validate, self.valid_wav_file)
+        self._assert_single_call(mock_whisper.load_model, "turbo")
+        self._assert_single_call(self.mock_model.transcribe, self.valid_wav_file,
+                                 verbose=False, fp16=False)
     
+    @patch('src.services.transcriber.whisper')
     @patch('src.services.transcriber.validate_file_exists')
-    def test_transcribe_whisper_error(self, mock_validate):
-        """Test transcription with Whisper error."""
-        # Setup mocks
-        mock_validate.return_value = None
-        
-        mock_model = MagicMock()
-        mock_model.transcribe.side_effect = Exception("Whisper processing error")
-        mock_whisper.load_model.return_value = mock_model
-        
-        # Test transcription with Whisper error
-        with self.assertRaises(TranscriberError) as context:
-            self.transcriber.transcribe(self.valid_wav_file)
-        
-        self.assertIn("Failed to transcribe audio", str(context.exception))
-        self.assertIn("Whisper processing error", str(context.exception))
-    
-    @patch('src.services.transcriber.validate_file_exists')
-    def test_load_model(self, mock_validate):
+    def test_load_model(self, mock_validate, mock_whisper):
         """Test model loading."""
+        mock_whisper.load_model.return_value = self.mock_model
+        transcriber = Transcriber()
         # Setup mocks
         mock_validate.return_value = None
-        mock_model = MagicMock()
-        mock_model.transcribe.return_value = {
+        self.mock_model.transcribe.return_value = {
             'text': 'Test transcription',
             'language': 'en'
         }
-        mock_whisper.load_model.return_value = mock_model
         
         # First call should load the model
-        result = self.transcriber.transcribe(self.valid_wav_file)
+        result = transcriber.transcribe(self.valid_wav_file)
         self.assertEqual(result, "Test transcription")
-        self.assertIsNotNone(self.transcriber.model)
+        self.assertIs(transcriber.model, self.mock_model)
         
-        # Second call should reuse the model
-        mock_whisper.load_model.reset_mock()
-        result2 = self.transcriber.transcribe(self.valid_wav_file)
-        mock_whisper.load_model.assert_not_called()  # Should not load again
+        # The loaded model is kept, so later calls skip load_model
+        transcriber._load_model()
+        self.assertEqual(mock_whisper.load_model.call_count, 1)
     
+    @patch('src.services.transcriber.whisper')
     @patch('src.services.transcriber.validate_file_exists')
-    def test_transcribe_generic_error(self, mock_validate):
-        """Test transcription with generic error."""
-        # Setup validation error
-        mock_validate.side_effect = ValidationError("File does not exist")
+    def test_transcribe_options_follow_language(self, mock_validate, mock_whisper):
+        """Test that transcription options follow the current language."""
+        mock_whisper.load_model.return_value = self.mock_model
+        transcriber = Transcriber()
+        mock_validate.return_value = None
+        self.mock_model.transcribe.return_value = {
+            'text': 'Hola mundo',
+            'language': 'es'
+        }
         
-        # Test transcription with validation error
-        with self.assertRaises(TranscriberError) as context:
-            self.transcriber.transcribe(self.valid_wav_file)
+        transcriber.transcribe(self.valid_wav_file)
+        self.assertNotIn('language', self.mock_model.transcribe.call_args.kwargs)
+        
+        transcriber.set_language("es")
+        transcriber.transcribe(self.valid_wav_file)
+        self.assertEqual(self.mock_model.transcribe.call_args.kwargs['language'], "es")
         
-        self.assertIn("Audio file validation failed", str(context.exception))
-        self.assertIn("File does not exist", str(context.exception))
+        # Assigning the public attribute directly is honoured too
+        transcriber.language = "fr"
+        transcriber.transcribe(self.valid_wav_file)
+        self.assertEqual(self.mock_model.transcribe.call_args.kwargs['language'], "fr")
     
     @patch('src.services.transcriber.validate_file_exists')
     def test_transcribe_to_model_success(self, mock_validate):
@@ -212,15 +204,13 @@ class TestTranscriber(unittest.TestCase):
         # Setup mocks
         mock_validate.return_value = None
         
-        mock_model = MagicMock()
-        mock_model.transcribe.return_value = {
+        self.mock_model.transcribe.return_value = {
             'text': 'Hello world test transcription',
             'language': 'en',
             'segments': [{
                 'avg_logprob': -0.5
             }]
         }
-        mock_whisper.load_model.return_value = mock_model
         
         result = self.transcriber.transcribe_to_model(self.valid_wav_file)
         
@@ -230,61 +220,34 @@ class TestTranscriber(unittest.TestCase):
         self.assertGreater(result.confidence, 0)  # Should have calculated confidence
     
     @patch('src.services.transcriber.validate_file_exists')
-    def test_transcribe_to_model_error(self, mock_validate):
-        """Test transcription to model with error."""
-        # Setup validation error
-        mock_validate.side_effect = ValidationError("File validation failed")
-        
-        with self.assertRaises(TranscriberError) as context:
-            self.transcriber.transcribe_to_model(self.valid_wav_file)
-        
-        self.assertIn("Audio file validation failed", str(context.exception))
-        self.assertIn("File validation failed", str(context.exception))
-    
-    @patch('src.services.transcriber.validate_file_exists')
-    def test_transcribe_to_model_generic_error(self, mock_validate):
-        """Test transcription to model with generic error."""
-        # Setup mocks
-        mock_validate.return_value = None
-        
-        mock_model = MagicMock()
-        mock_model.transcribe.side_effect = ValueError("Some other error")
-        mock_whisper.load_model.return_value = mock_model
-        
-        with self.assertRaises(TranscriberError) as context:
-            self.transcriber.transcribe_to_model(self.valid_wav_file)
-        
-        self.assertIn("Failed to create transcription model", str(context.exception))
-        self.assertIn("Some other error", str(context.exception))
+    def test_transcribe_to_model_error_paths(self, mock_validate):
+        """Test that transcription model failures are wrapped in TranscriberError."""
+        # (case, validation error, Whisper error, expected messages)
+        cases = (
+            ("validation", ValidationError("File validation failed"), None,
+             ("Audio file validation failed", "File validation failed")),
+            ("generic", None, ValueError("Some other error"),
+             ("Failed to create transcription model", "Some other error")),
+        )
+        for case, validation_error, whisper_error, messages in cases:
+            with self.subTest(case=case):
+                mock_validate.side_effect = validation_error
+                self.mock_model.transcribe.side_effect = whisper_error
+                
+                with self.assertRaises(TranscriberError) as context:
+                    self.transcriber.transcribe_to_model(self.valid_wav_file)
+                
+                for message in messages:
+                    self.assertIn(message, str(context.exception))
     
     def test_different_audio_formats(self):
         """Test that Whisper supports many audio formats."""
-        supported_files = [
-            "test.wav",
-            "test.mp3", 
-            "test.flac",
-            "test.m4a",
-            "test.ogg",
-            "test.opus",
-            "test.aac",
-            "test.aiff",
-            "test.wma"
-        ]
+        expected_formats = {'.wav', '.mp3', '.flac', '.m4a', '.ogg', '.opus', '.aac', '.aiff', '.wma'}
         
-        formats = self.transcriber.get_supported_formats()
-        
-        for filename in supported_files:
-            extension = os.path.splitext(filename)[1]
-            with self.subTest(extension=extension):
-                self.assertIn(extension, formats, f"Format {extension} should be supported by Whisper")
-    
-    def test_transcriber_error_inheritance(self):
-        """Test that TranscriberError is properly inherited from Exception."""
-        self.assertTrue(issubclass(TranscriberError, Exception))
+        formats = set(self.transcriber.get_supported_formats())
         
-        # Test raising and catching
-        with self.assertRaises(TranscriberError):
-            raise TranscriberError("Test error")
+        # Report every missing format at once
+        self.assertEqual(expected_formats - formats, set(), "All formats should be supported by Whisper")
 
 
 if __name__ == '__main__':
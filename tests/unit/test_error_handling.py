@@ -1,26 +1,13 @@
 """Comprehensive error handling tests for the video transcriber pipeline."""
 
 import os
-import sys
 import tempfile
 import unittest
+from contextlib import ExitStack
+from subprocess import TimeoutExpired
 from unittest.mock import patch, MagicMock, Mock
 from pathlib import Path
 
-# Mock speech_recognition module since it may not be installed
-class MockUnknownValueError(Exception):
-    pass
-
-class MockRequestError(Exception):
-    pass
-
-mock_sr = MagicMock()
-mock_sr.Recognizer = MagicMock
-mock_sr.AudioFile = MagicMock
-mock_sr.UnknownValueError = MockUnknownValueError
-mock_sr.RequestError = MockRequestError
-sys.modules['speech_recognition'] = mock_sr
-
 from src.models.video_file import VideoFile
 from src.services.audio_extractor import AudioExtractor
 from src.services.transcriber import Transcriber, TranscriberError
@@ -33,23 +20,41 @@ from src.utils.validators import ValidationError
 class TestErrorHandling(unittest.TestCase):
     """Test cases for comprehensive error handling scenarios."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_video_path = os.path.join(self.temp_dir, "test_video.mp4")
-        self.nonexistent_video_path = "/nonexistent/path/video.mp4"
-        self.invalid_format_path = os.path.join(self.temp_dir, "test.txt")
+    @classmethod
+    def setUpClass(cls):
+        """Create the shared test files once for the whole test class."""
+        cls._temp_dir_ctx = tempfile.TemporaryDirectory()
+        cls.temp_dir = cls._temp_dir_ctx.name
+        cls.test_video_path = os.path.join(cls.temp_dir, "test_video.mp4")
+        cls.nonexistent_video_path = "/nonexistent/path/video.mp4"
+        cls.invalid_format_path = os.path.join(cls.temp_dir, "test.txt")
         
         # Create test files
-        with open(self.test_video_path, 'wb') as f:
+        with open(cls.test_video_path, 'wb') as f:
             f.write(b"fake video content")
-        with open(self.invalid_format_path, 'w') as f:
+        with open(cls.invalid_format_path, 'w') as f:
             f.write("not a video file")
     
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared temporary directory."""
+        cls._temp_dir_ctx.cleanup()
+    
+    def _create_temp_file(self, filename: str, content: bytes) -> str:
+        """Create a file in the shared temp directory, removed after the test.
+        
+        Args:
+            filename: Name of the file to create
+            content: Bytes to write to the file
+            
+        Returns:
+            Path to the created file
+        """
+        file_path = os.path.join(self.temp_dir, filename)
+        with open(file_path, 'wb') as f:
+            f.write(content)
+        self.addCleanup(os.remove, file_path)
+        return file_path
     
     # Video File Error Handling Tests
     
@@ -124,7 +129,6 @@ class TestErrorHandling(unittest.TestCase):
         mock_config.get_temp_directory.return_value = self.temp_dir
         mock_get_config.return_value = mock_config
         
-        from subprocess import TimeoutExpired
         mock_subprocess.side_effect = TimeoutExpired(cmd=['ffmpeg'], timeout=300)
         
         extractor = AudioExtractor()
@@ -153,12 +157,14 @@ class TestErrorHandling(unittest.TestCase):
         transcriber = Transcriber()
         
         # Create unsupported audio format file
-        unsupported_file = os.path.join(self.temp_dir, "test.mp3")
-        with open(unsupported_file, 'wb') as f:
-            f.write(b"fake audio content")
+        unsupported_file = self._create_temp_file("test.mp3", b"fake audio content")
         
-        with self.assertRaises(TranscriberError):
-            transcriber.transcribe(unsupported_file)
+        # Whisper fails to decode the fake audio content
+        with patch('src.services.transcriber.whisper.load_model') as mock_load_model:
+            mock_load_model.return_value.transcribe.side_effect = RuntimeError("Failed to load audio")
+            
+            with self.assertRaises(TranscriberError):
+                transcriber.transcribe(unsupported_file)
     
     def test_transcriber_nonexistent_audio_file_error(self):
         """Test Transcriber handles non-existent audio files gracefully."""
@@ -171,9 +177,7 @@ class TestErrorHandling(unittest.TestCase):
     def test_transcriber_speech_recognition_api_error(self, mock_recognizer):
         """Test Transcriber handles speech recognition API errors gracefully."""
         # Create valid audio file
-        valid_audio = os.path.join(self.temp_dir, "test.wav")
-        with open(valid_audio, 'wb') as f:
-            f.write(b"fake wav content")
+        valid_audio = self._create_temp_file("test.wav", b"fake wav content")
         
         # Mock speech recognition request error
         mock_instance = mock_recognizer.return_value
@@ -187,9 +191,7 @@ class TestErrorHandling(unittest.TestCase):
     @patch('src.services.transcriber.sr.AudioFile')
     def test_transcriber_audio_file_read_error(self, mock_audio_file):
         """Test Transcriber handles audio file read errors gracefully."""
-        valid_audio = os.path.join(self.temp_dir, "test.wav")
-        with open(valid_audio, 'wb') as f:
-            f.write(b"fake wav content")
+        valid_audio = self._create_temp_file("test.wav", b"fake wav content")
         
         # Mock audio file read error
         mock_audio_file.side_effect = Exception("Cannot read audio file")
@@ -213,59 +215,32 @@ class TestErrorHandling(unittest.TestCase):
             
             self.assertIsNone(result)
     
-    def test_summarizer_invalid_api_key_error(self):
-        """Test Summarizer handles invalid API key gracefully."""
-        summarizer = Summarizer(api_key="invalid-key")
-        
-        with patch('src.services.summarizer.requests.post') as mock_post:
-            mock_response = Mock()
-            mock_response.status_code = 401
-            mock_response.json.return_value = {"error": {"message": "Invalid API key"}}
-            mock_post.return_value = mock_response
-            
-            result = summarizer.generate_summary("test text")
-            
-            self.assertIsNone(result)
-    
-    @patch('src.services.summarizer.requests.post')
-    def test_summarizer_network_error(self, mock_post):
-        """Test Summarizer handles network errors gracefully."""
-        summarizer = Summarizer(api_key="sk-test-key")
-        
-        # Mock network error
-        mock_post.side_effect = Exception("Network connection error")
-        
-        result = summarizer.generate_summary("test text")
-        
-        self.assertIsNone(result)
-    
-    @patch('src.services.summarizer.requests.post')
-    def test_summarizer_rate_limit_error(self, mock_post):
-        """Test Summarizer handles rate limit errors gracefully."""
-        summarizer = Summarizer(api_key="sk-test-key")
-        
-        mock_response = Mock()
-        mock_response.status_code = 429
-        mock_response.json.return_value = {"error": {"message": "Rate limit exceeded"}}
-        mock_post.return_value = mock_response
-        
-        result = summarizer.generate_summary("test text")
-        
-        self.assertIsNone(result)
-    
-    @patch('src.services.summarizer.requests.post')
-    def test_summarizer_malformed_response_error(self, mock_post):
-        """Test Summarizer handles malformed API responses gracefully."""
-        summarizer = Summarizer(api_key="sk-test-key")
-        
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"invalid": "response format"}
-        mock_post.return_value = mock_response
-        
-        result = summarizer.generate_summary("test text")
-        
-        self.assertIsNone(result)
+    @patch('src.services.summarizer.requests.Session.post')
+    def test_summarizer_api_errors(self, mock_post):
+        """Test Summarizer handles API and network errors gracefully."""
+        # (case, API key, status code, response JSON, request error)
+        cases = (
+            ("invalid api key", "invalid-key", 401,
+             {"error": {"message": "Invalid API key"}}, None),
+            ("network error", "sk-test-key", None, None,
+             Exception("Network connection error")),
+            ("rate limit", "sk-test-key", 429,
+             {"error": {"message": "Rate limit exceeded"}}, None),
+            ("malformed response", "sk-test-key", 200,
+             {"invalid": "response format"}, None),
+        )
+        for case, api_key, status_code, body, error in cases:
+            with self.subTest(case=case):
+                mock_response = Mock()
+                mock_response.status_code = status_code
+                mock_response.json.return_value = body
+                mock_post.return_value = mock_response
+                mock_post.side_effect = error
+                
+                summarizer = Summarizer(api_key=api_key)
+                result = summarizer.generate_summary("test text")
+                
+                self.assertIsNone(result)
     
     def test_summarizer_empty_text_input_error(self):
         """Test Summarizer handles empty text input gracefully."""
@@ -280,13 +255,13 @@ class TestErrorHandling(unittest.TestCase):
     def test_file_handler_permission_denied_error(self):
         """Test FileHandler handles permission denied errors gracefully."""
         # Try to write to a read-only location (simulated)
-        with patch('builtins.open', side_effect=PermissionError("Permission denied")):
+        with patch('src.utils.file_handler.open', create=True, side_effect=PermissionError("Permission denied")):
             result = FileHandler.write_text_file("/protected/file.txt", "test content")
             self.assertFalse(result)
     
     def test_file_handler_disk_full_error(self):
         """Test FileHandler handles disk full errors gracefully."""
-        with patch('builtins.open', side_effect=OSError("No space left on device")):
+        with patch('src.utils.file_handler.open', create=True, side_effect=OSError("No space left on device")):
             result = FileHandler.write_text_file(os.path.join(self.temp_dir, "test.txt"), "test content")
             self.assertFalse(result)
     
@@ -298,7 +273,7 @@ class TestErrorHandling(unittest.TestCase):
     
     def test_file_handler_corrupted_file_read_error(self):
         """Test FileHandler handles corrupted file read errors gracefully."""
-        with patch('builtins.open', side_effect=UnicodeDecodeError('utf-8', b'', 0, 1, 'invalid start byte')):
+        with patch('src.utils.file_handler.open', create=True, side_effect=UnicodeDecodeError('utf-8', b'', 0, 1, 'invalid start byte')):
             result = FileHandler.read_text_file(self.test_video_path)
             self.assertIsNone(result)
     
@@ -316,17 +291,18 @@ class TestErrorHandling(unittest.TestCase):
     
     def test_config_file_corrupted_error(self):
         """Test Config handles corrupted config file gracefully."""
-        corrupted_config_path = os.path.join(self.temp_dir, "corrupted_config.txt")
-        with open(corrupted_config_path, 'w') as f:
-            f.write("invalid=config=format=with=too=many=equals\n")
-            f.write("malformed line without equals\n")
-            f.write("=empty_key\n")
+        corrupted_config_path = self._create_temp_file(
+            "corrupted_config.txt",
+            b"invalid=config=format=with=too=many=equals\n"
+            b"malformed line without equals\n"
+            b"=empty_key\n"
+        )
         
         # Should handle corrupted config gracefully
         config = Config(config_file=corrupted_config_path)
         self.assertIsNotNone(config)
     
-    @patch('builtins.open')
+    @patch('src.utils.config.open', create=True)
     def test_config_save_permission_error(self, mock_open):
         """Test Config handles config save permission errors gracefully."""
         mock_open.side_effect = PermissionError("Permission denied")
@@ -342,28 +318,30 @@ class TestErrorHandling(unittest.TestCase):
     def test_pipeline_cascade_failure_scenario(self):
         """Test how pipeline handles cascade failure scenarios."""
         # Simulate a scenario where multiple components fail
-        with patch('src.services.audio_extractor.subprocess.run', side_effect=FileNotFoundError("ffmpeg not found")):
-            with patch('src.services.transcriber.sr.Recognizer') as mock_recognizer:
-                mock_instance = mock_recognizer.return_value
-                mock_instance.recognize_google.side_effect = Exception("API failed")
-                
-                with patch('src.services.summarizer.requests.post', side_effect=Exception("Network error")):
-                    # Each component should handle its own errors gracefully
-                    
-                    # Audio extraction should fail gracefully
-                    extractor = AudioExtractor()
-                    audio_path = extractor.extract_audio(self.test_video_path)
-                    self.assertIsNone(audio_path)
-                    
-                    # Transcription should fail gracefully
-                    transcriber = Transcriber()
-                    with self.assertRaises((TranscriberError, ValidationError)):
-                        transcriber.transcribe("/fake/audio.wav")
-                    
-                    # Summarization should fail gracefully
-                    summarizer = Summarizer(api_key="sk-test-key")
-                    summary = summarizer.generate_summary("test text")
-                    self.assertIsNone(summary)
+        with ExitStack() as stack:
+            stack.enter_context(patch('src.services.audio_extractor.subprocess.run',
+                                      side_effect=FileNotFoundError("ffmpeg not found")))
+            stack.enter_context(patch('src.services.transcriber.whisper.load_model',
+                                      side_effect=Exception("Model load failed")))
+            stack.enter_context(patch('src.services.summarizer.requests.Session.post',
+                                      side_effect=Exception("Network error")))
+            
+            # Each component should handle its own errors gracefully
+            
+            # Audio extraction should fail gracefully
+            extractor = AudioExtractor()
+            audio_path = extractor.extract_audio(self.test_video_path)
+            self.assertIsNone(audio_path)
+            
+            # Transcription should fail gracefully
+            transcriber = Transcriber()
+            with self.assertRaises((TranscriberError, ValidationError)):
+                transcriber.transcribe("/fake/audio.wav")
+            
+            # Summarization should fail gracefully
+            summarizer = Summarizer(api_key="sk-test-key")
+            summary = summarizer.generate_summary("test text")
+            self.assertIsNone(summary)
     
     def test_cleanup_on_failure_scenario(self):
         """Test that temporary files are cleaned up even when failures occur."""
@@ -374,9 +352,7 @@ class TestErrorHandling(unittest.TestCase):
             
             extractor = AudioExtractor()
             # Manually add temp files to simulate partial processing
-            fake_temp_file = os.path.join(self.temp_dir, "fake_temp.wav")
-            with open(fake_temp_file, 'w') as f:
-                f.write("fake temp content")
+            fake_temp_file = self._create_temp_file("fake_temp.wav", b"fake temp content")
             
             extractor._temp_files.append(fake_temp_file)
             
@@ -3,39 +3,50 @@ Unit tests for the main CLI entry point.
 """
 
 import unittest
-import tempfile
 import os
-import sys
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock, call
 from pathlib import Path
 
-# Mock the speech_recognition module
-mock_sr = MagicMock()
-sys.modules['speech_recognition'] = mock_sr
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
-
 from main import VideoTranscriberCLI, main
 from models.transcription import Transcription
-from models.summary import Summary
+from services.transcriber import TranscriberError
 from utils.validators import ValidationError
 
 
+def _run_main():
+    """
+    Run main() and capture the code it exits with.
+    
+    Returns:
+        The SystemExit code, or None if main() returned without exiting
+    """
+    try:
+        main()
+    except SystemExit as e:
+        return e.code
+    return None
+
+
 class TestVideoTranscriberCLI(unittest.TestCase):
     """Test cases for the VideoTranscriberCLI class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.test_video_path = os.path.join(self.temp_dir, "test_video.mp4")
-        self.output_dir = os.path.join(self.temp_dir, "output")
-        
-        # Create test video file
-        with open(self.test_video_path, 'wb') as f:
-            f.write(b"fake video content for testing")
-        
-        # Create CLI instance with mocked dependencies
+    @classmethod
+    def setUpClass(cls):
+        """Set up the mocked CLI and input validation once for the whole class."""
+        # Input validation and VideoFile are patched for every test, so no real
+        # video file or output directory is needed
+        cls.test_video_path = "/fake/videos/test_video.mp4"
+        cls.output_dir = "/fake/output"
+        cls.expected_transcription_file = os.path.join(cls.output_dir, "test_video_transcription.txt")
+        cls.expected_summary_file = os.path.join(cls.output_dir, "test_video_summary.txt")
+        
+        cls.mock_validate_video = cls._start_class_patch('main.validate_video_file')
+        cls.mock_validate_output = cls._start_class_patch('main.validate_output_directory')
+        cls.mock_video_file = cls._start_class_patch('main.VideoFile')
+        cls.mock_validate_api = cls._start_class_patch('main.validate_api_key')
+        
+        # Create the CLI instance with mocked dependencies once; setUp resets them
         with patch.multiple(
             'main',
             Config=MagicMock,
@@ -44,56 +55,86 @@ class TestVideoTranscriberCLI(unittest.TestCase):
             Transcriber=MagicMock,
             Summarizer=MagicMock
         ):
-            self.cli = VideoTranscriberCLI()
+            cls._shared_cli = VideoTranscriberCLI()
+        
+        cls._transcription = MagicMock(spec=Transcription)
     
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
+    @classmethod
+    def _start_class_patch(cls, target):
+        """Patch a target until the class is torn down.
+        
+        Args:
+            target: Dotted path of the attribute to patch
+            
+        Returns:
+            The MagicMock installed in place of the target
+        """
+        patcher = patch(target)
+        cls.addClassCleanup(patcher.stop)
+        return patcher.start()
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.cli = self._shared_cli
+        self._reset_services()
+    
+    def _reset_services(self):
+        """Reset the shared mocks to a valid input and empty service state."""
+        for mock in (self.cli.config, self.cli.file_handler, self.cli.audio_extractor,
+                     self.cli.transcriber, self.cli.summarizer, self._transcription,
+                     self.mock_validate_video, self.mock_validate_output,
+                     self.mock_video_file, self.mock_validate_api):
+            mock.reset_mock(return_value=True, side_effect=True)
+        
+        self.mock_validate_video.return_value = (True, "")
+        self.mock_validate_output.return_value = None
+        self.mock_validate_api.return_value = None
+        self.mock_video_file.return_value = SimpleNamespace(filename="test_video.mp4", validate=lambda: None)
     
-    @patch('main.validate_video_file')
-    @patch('main.validate_output_directory')
-    @patch('main.VideoFile')
-    def test_run_success_with_summary(self, mock_video_file, mock_validate_output, mock_validate_video):
+    def _mock_transcription(self, text="This is the transcribed text", word_count=5, confidence=0.95):
+        """Make the transcriber return the shared Transcription mock.
+        
+        Args:
+            text: Transcribed text
+            word_count: Value returned by get_word_count
+            confidence: Transcription confidence score
+            
+        Returns:
+            The configured Transcription mock
+        """
+        transcription = self._transcription
+        transcription.configure_mock(**{
+            "text": text,
+            "confidence": confidence,
+            "get_word_count.return_value": word_count,
+            "save_to_file.return_value": None,
+        })
+        self.cli.transcriber.transcribe_to_model.return_value = transcription
+        return transcription
+    
+    def test_run_success_with_summary(self):
         """Test successful pipeline run with summary generation."""
-        # Setup validation mocks
-        mock_validate_video.return_value = (True, "")
-        mock_validate_output.return_value = None
-        
-        # Setup VideoFile mock
-        mock_video = MagicMock()
-        mock_video.filename = "test_video.mp4"
-        mock_video_file.return_value = mock_video
-        
         # Setup service mocks
         self.cli.audio_extractor.extract_audio.return_value = "/tmp/audio.wav"
         self.cli.audio_extractor.cleanup_temp_files.return_value = None
         
         # Setup transcription mock
-        mock_transcription = MagicMock(spec=Transcription)
-        mock_transcription.text = "This is the transcribed text"
-        mock_transcription.get_word_count.return_value = 5
-        mock_transcription.confidence = 0.95
-        mock_transcription.save_to_file.return_value = None
-        self.cli.transcriber.transcribe_to_model.return_value = mock_transcription
+        self._mock_transcription()
         
         # Setup summary mock
-        mock_summary = MagicMock(spec=Summary)
-        mock_summary.get_compression_ratio.return_value = 3.5
-        mock_summary.save_to_file.return_value = None
+        mock_summary = SimpleNamespace(get_compression_ratio=lambda: 3.5, save_to_file=lambda path: None)
         self.cli.summarizer.generate_summary.return_value = mock_summary
         
         # Run pipeline
-        with patch('main.validate_api_key'):
-            result = self.cli.run(self.test_video_path, self.output_dir, "test-api-key")
+        result = self.cli.run(self.test_video_path, self.output_dir, "test-api-key")
         
         # Verify results
         self.assertTrue(result["success"])
         self.assertEqual(result["video_file"], self.test_video_path)
         self.assertEqual(result["transcription_word_count"], 5)
         self.assertEqual(result["transcription_confidence"], 0.95)
-        self.assertIn("test_video_transcription.txt", result["transcription_file"])
-        self.assertIn("test_video_summary.txt", result["summary_file"])
+        self.assertEqual(result["transcription_file"], self.expected_transcription_file)
+        self.assertEqual(result["summary_file"], self.expected_summary_file)
         
         # Verify service calls
         self.cli.audio_extractor.extract_audio.assert_called_once_with(self.test_video_path)
@@ -101,31 +142,14 @@ class TestVideoTranscriberCLI(unittest.TestCase):
         self.cli.summarizer.generate_summary.assert_called_once_with("This is the transcribed text", "test-api-key")
         self.cli.audio_extractor.cleanup_temp_files.assert_called_once()
     
-    @patch('main.validate_video_file')
-    @patch('main.validate_output_directory')
-    @patch('main.VideoFile')
-    def test_run_success_without_summary(self, mock_video_file, mock_validate_output, mock_validate_video):
+    def test_run_success_without_summary(self):
         """Test successful pipeline run without summary generation."""
-        # Setup validation mocks
-        mock_validate_video.return_value = (True, "")
-        mock_validate_output.return_value = None
-        
-        # Setup VideoFile mock
-        mock_video = MagicMock()
-        mock_video.filename = "test_video.mp4"
-        mock_video_file.return_value = mock_video
-        
         # Setup service mocks
         self.cli.audio_extractor.extract_audio.return_value = "/tmp/audio.wav"
         self.cli.audio_extractor.cleanup_temp_files.return_value = None
         
         # Setup transcription mock
-        mock_transcription = MagicMock(spec=Transcription)
-        mock_transcription.text = "This is the transcribed text"
-        mock_transcription.get_word_count.return_value = 5
-        mock_transcription.confidence = 0.95
-        mock_transcription.save_to_file.return_value = None
-        self.cli.transcriber.transcribe_to_model.return_value = mock_transcription
+        self._mock_transcription()
         
         # Run pipeline without API key
         result = self.cli.run(self.test_video_path, self.output_dir)
@@ -138,10 +162,9 @@ class TestVideoTranscriberCLI(unittest.TestCase):
         # Verify summarizer was not called
         self.cli.summarizer.generate_summary.assert_not_called()
     
-    @patch('main.validate_video_file')
-    def test_run_invalid_video_file(self, mock_validate_video):
+    def test_run_invalid_video_file(self):
         """Test pipeline with invalid video file."""
-        mock_validate_video.return_value = (False, "File does not exist")
+        self.mock_validate_video.return_value = (False, "File does not exist")
         
         result = self.cli.run("nonexistent.mp4", self.output_dir)
         
@@ -149,86 +172,40 @@ class TestVideoTranscriberCLI(unittest.TestCase):
         self.assertIn("Invalid video file", result["error"])
         self.assertIn("File does not exist", result["error"])
     
-    @patch('main.validate_video_file')
-    @patch('main.validate_output_directory')
-    @patch('main.VideoFile')
-    def test_run_audio_extraction_failure(self, mock_video_file, mock_validate_output, mock_validate_video):
-        """Test pipeline with audio extraction failure."""
-        # Setup validation mocks
-        mock_validate_video.return_value = (True, "")
-        mock_validate_output.return_value = None
-        
-        # Setup VideoFile mock
-        mock_video = MagicMock()
-        mock_video.filename = "test_video.mp4"
-        mock_video_file.return_value = mock_video
-        
-        # Make audio extraction fail
-        self.cli.audio_extractor.extract_audio.side_effect = RuntimeError("FFmpeg not found")
-        
-        result = self.cli.run(self.test_video_path, self.output_dir)
-        
-        self.assertFalse(result["success"])
-        self.assertIn("Audio extraction failed", result["error"])
-        self.assertIn("FFmpeg not found", result["error"])
+    def test_run_service_failures(self):
+        """Test pipeline failures in audio extraction and transcription."""
+        # (case, failing service, raised error, expected messages, cleanup expected)
+        cases = (
+            ("audio extraction", "audio_extractor.extract_audio", RuntimeError("FFmpeg not found"),
+             ("Audio extraction failed", "FFmpeg not found"), False),
+            ("transcriber error", "transcriber.transcribe_to_model", TranscriberError("No speech detected"),
+             ("Transcription failed", "No speech detected"), True),
+            ("transcription runtime error", "transcriber.transcribe_to_model", RuntimeError("Transcription error"),
+             ("Transcription failed", "Transcription error"), True),
+        )
+        for case, target, error, messages, cleaned_up in cases:
+            with self.subTest(case=case):
+                self._reset_services()
+                self.cli.audio_extractor.extract_audio.return_value = "/tmp/audio.wav"
+                service_name, method_name = target.split(".")
+                getattr(getattr(self.cli, service_name), method_name).side_effect = error
+                
+                result = self.cli.run(self.test_video_path, self.output_dir)
+                
+                self.assertFalse(result["success"])
+                for message in messages:
+                    self.assertIn(message, result["error"])
+                # Cleanup runs whenever transcription was attempted
+                self.assertEqual(self.cli.audio_extractor.cleanup_temp_files.call_count,
+                                 1 if cleaned_up else 0)
     
-    @patch('main.validate_video_file')
-    @patch('main.validate_output_directory')
-    @patch('main.VideoFile')
-    def test_run_transcription_failure(self, mock_video_file, mock_validate_output, mock_validate_video):
-        """Test pipeline with transcription failure."""
-        # Setup validation mocks
-        mock_validate_video.return_value = (True, "")
-        mock_validate_output.return_value = None
-        
-        # Setup VideoFile mock
-        mock_video = MagicMock()
-        mock_video.filename = "test_video.mp4"
-        mock_video_file.return_value = mock_video
-        
-        # Setup successful audio extraction
-        self.cli.audio_extractor.extract_audio.return_value = "/tmp/audio.wav"
-        self.cli.audio_extractor.cleanup_temp_files.return_value = None
-        
-        # Make transcription fail
-        from services.transcriber import TranscriberError
-        self.cli.transcriber.transcribe_to_model.side_effect = TranscriberError("No speech detected")
-        
-        result = self.cli.run(self.test_video_path, self.output_dir)
-        
-        self.assertFalse(result["success"])
-        self.assertIn("Transcription failed", result["error"])
-        self.assertIn("No speech detected", result["error"])
-        
-        # Verify cleanup was still called
-        self.cli.audio_extractor.cleanup_temp_files.assert_called_once()
-    
-    @patch('main.validate_video_file')
-    @patch('main.validate_output_directory')
-    @patch('main.VideoFile')
-    @patch('main.validate_api_key')
-    def test_run_summary_failure_continues(self, mock_validate_api, mock_video_file, mock_validate_output, mock_validate_video):
+    def test_run_summary_failure_continues(self):
         """Test that pipeline continues when summary generation fails."""
-        # Setup validation mocks
-        mock_validate_video.return_value = (True, "")
-        mock_validate_output.return_value = None
-        mock_validate_api.return_value = None
-        
-        # Setup VideoFile mock
-        mock_video = MagicMock()
-        mock_video.filename = "test_video.mp4"
-        mock_video_file.return_value = mock_video
-        
         # Setup successful services
         self.cli.audio_extractor.extract_audio.return_value = "/tmp/audio.wav"
         self.cli.audio_extractor.cleanup_temp_files.return_value = None
         
-        mock_transcription = MagicMock(spec=Transcription)
-        mock_transcription.text = "This is the transcribed text"
-        mock_transcription.get_word_count.return_value = 5
-        mock_transcription.confidence = 0.95
-        mock_transcription.save_to_file.return_value = None
-        self.cli.transcriber.transcribe_to_model.return_value = mock_transcription
+        self._mock_transcription()
         
         # Make summary generation fail
         self.cli.summarizer.generate_summary.side_effect = RuntimeError("API rate limit exceeded")
@@ -238,67 +215,22 @@ class TestVideoTranscriberCLI(unittest.TestCase):
         # Should still succeed with transcription
         self.assertTrue(result["success"])
         self.assertIsNone(result["summary_file"])
-        self.assertIn("transcription.txt", result["transcription_file"])
+        self.assertEqual(result["transcription_file"], self.expected_transcription_file)
     
-    @patch('main.validate_output_directory')
-    def test_run_output_directory_validation_failure(self, mock_validate_output):
+    def test_run_output_directory_validation_failure(self):
         """Test pipeline with output directory validation failure."""
-        mock_validate_output.side_effect = ValidationError("Permission denied")
+        self.mock_validate_output.side_effect = ValidationError("Permission denied")
         
         result = self.cli.run(self.test_video_path, "/root/restricted")
         
         self.assertFalse(result["success"])
         self.assertIn("Permission denied", result["error"])
     
-    @patch('main.validate_video_file')
-    @patch('main.validate_output_directory')
-    @patch('main.VideoFile')
-    def test_cleanup_on_failure(self, mock_video_file, mock_validate_output, mock_validate_video):
-        """Test that cleanup is called even when pipeline fails."""
-        # Setup validation mocks
-        mock_validate_video.return_value = (True, "")
-        mock_validate_output.return_value = None
-        
-        # Setup VideoFile mock
-        mock_video = MagicMock()
-        mock_video.filename = "test_video.mp4"
-        mock_video_file.return_value = mock_video
-        
-        # Setup successful audio extraction
-        self.cli.audio_extractor.extract_audio.return_value = "/tmp/audio.wav"
-        self.cli.audio_extractor.cleanup_temp_files.return_value = None
-        
-        # Make transcription fail
-        self.cli.transcriber.transcribe_to_model.side_effect = RuntimeError("Transcription error")
-        
-        result = self.cli.run(self.test_video_path, self.output_dir)
-        
-        self.assertFalse(result["success"])
-        # Verify cleanup was called despite failure
-        self.cli.audio_extractor.cleanup_temp_files.assert_called_once()
-    
-    @patch('main.validate_video_file')
-    @patch('main.validate_output_directory')
-    @patch('main.VideoFile')
-    def test_cleanup_failure_warning(self, mock_video_file, mock_validate_output, mock_validate_video):
+    def test_cleanup_failure_warning(self):
         """Test handling of cleanup failure."""
-        # Setup validation mocks
-        mock_validate_video.return_value = (True, "")
-        mock_validate_output.return_value = None
-        
-        # Setup VideoFile mock
-        mock_video = MagicMock()
-        mock_video.filename = "test_video.mp4"
-        mock_video_file.return_value = mock_video
-        
         # Setup successful services
         self.cli.audio_extractor.extract_audio.return_value = "/tmp/audio.wav"
-        mock_transcription = MagicMock(spec=Transcription)
-        mock_transcription.text = "Text"
-        mock_transcription.get_word_count.return_value = 1
-        mock_transcription.confidence = 0.9
-        mock_transcription.save_to_file.return_value = None
-        self.cli.transcriber.transcribe_to_model.return_value = mock_transcription
+        self._mock_transcription(text="Text", word_count=1, confidence=0.9)
         
         # Make cleanup fail
         self.cli.audio_extractor.cleanup_temp_files.side_effect = OSError("File locked")
@@ -312,123 +244,98 @@ class TestVideoTranscriberCLI(unittest.TestCase):
 class TestMainFunction(unittest.TestCase):
     """Test cases for the main function."""
     
+    def setUp(self):
+        """Save OPENAI_API_KEY so tests can set it without copying os.environ."""
+        self._saved_api_key = os.environ.pop('OPENAI_API_KEY', None)
+    
+    def tearDown(self):
+        """Restore the saved OPENAI_API_KEY."""
+        os.environ.pop('OPENAI_API_KEY', None)
+        if self._saved_api_key is not None:
+            os.environ['OPENAI_API_KEY'] = self._saved_api_key
+    
+    def _configure_cli(self, mock_cli_class, api_key=None, language='en-US', success=True):
+        """
+        Configure the patched CLI's parsed arguments and pipeline result.
+        
+        Args:
+            mock_cli_class: Patched VideoTranscriberCLI class
+            api_key: Parsed --api-key value
+            language: Parsed --language value
+            success: Whether the pipeline run succeeds
+            
+        Returns:
+            The mock CLI instance main() will use
+        """
+        mock_cli = mock_cli_class.return_value
+        mock_cli.run.return_value = {"success": success}
+        mock_cli.parse_arguments.return_value = SimpleNamespace(
+            video_path='test.mp4',
+            output_dir='output',
+            api_key=api_key,
+            language=language,
+            format='default'
+        )
+        return mock_cli
+    
     @patch('main.VideoTranscriberCLI')
     @patch('sys.argv', ['main.py', 'test.mp4'])
     def test_main_success(self, mock_cli_class):
         """Test main function with successful pipeline."""
-        mock_cli = MagicMock()
-        mock_cli.run.return_value = {"success": True}
-        
-        # Mock parse_arguments to return expected values
-        mock_args = MagicMock()
-        mock_args.video_path = 'test.mp4'
-        mock_args.output_dir = 'output'
-        mock_args.api_key = None
-        mock_args.language = 'en-US'
-        mock_cli.parse_arguments.return_value = mock_args
+        mock_cli = self._configure_cli(mock_cli_class)
         
-        mock_cli_class.return_value = mock_cli
-        
-        with self.assertRaises(SystemExit) as context:
-            main()
-        
-        self.assertEqual(context.exception.code, 0)
+        self.assertEqual(_run_main(), 0)
         mock_cli.transcriber.set_language.assert_called_once_with("en-US")
     
     @patch('main.VideoTranscriberCLI')
     @patch('sys.argv', ['main.py', 'test.mp4', '--language', 'es-ES'])
     def test_main_custom_language(self, mock_cli_class):
         """Test main function with custom language."""
-        mock_cli = MagicMock()
-        mock_cli.run.return_value = {"success": True}
-        
-        # Mock parse_arguments to return expected values
-        mock_args = MagicMock()
-        mock_args.video_path = 'test.mp4'
-        mock_args.output_dir = 'output'
-        mock_args.api_key = None
-        mock_args.language = 'es-ES'
-        mock_cli.parse_arguments.return_value = mock_args
-        
-        mock_cli_class.return_value = mock_cli
+        mock_cli = self._configure_cli(mock_cli_class, language='es-ES')
         
-        with self.assertRaises(SystemExit) as context:
-            main()
-        
-        self.assertEqual(context.exception.code, 0)
+        self.assertEqual(_run_main(), 0)
         mock_cli.transcriber.set_language.assert_called_once_with("es-ES")
     
     @patch('main.VideoTranscriberCLI')
     @patch('sys.argv', ['main.py', 'test.mp4'])
     def test_main_failure(self, mock_cli_class):
         """Test main function with pipeline failure."""
-        mock_cli = MagicMock()
-        mock_cli.run.return_value = {"success": False}
-        mock_cli_class.return_value = mock_cli
-        
-        with self.assertRaises(SystemExit) as context:
-            main()
+        self._configure_cli(mock_cli_class, success=False)
         
-        self.assertEqual(context.exception.code, 1)
+        self.assertEqual(_run_main(), 1)
     
     @patch('main.VideoTranscriberCLI')
     @patch('sys.argv', ['main.py', 'test.mp4', '--api-key', 'sk-test123'])
-    @patch.dict('os.environ', {}, clear=True)
     def test_main_api_key_from_args(self, mock_cli_class):
         """Test main function with API key from command line."""
-        mock_cli = MagicMock()
-        mock_cli.run.return_value = {"success": True}
-        
-        # Mock parse_arguments to return expected values
-        mock_args = MagicMock()
-        mock_args.video_path = 'test.mp4'
-        mock_args.output_dir = 'output'
-        mock_args.api_key = 'sk-test123'
-        mock_args.language = 'en-US'
-        mock_cli.parse_arguments.return_value = mock_args
+        mock_cli = self._configure_cli(mock_cli_class, api_key='sk-test123')
         
-        mock_cli_class.return_value = mock_cli
-        
-        with self.assertRaises(SystemExit):
-            main()
+        self.assertEqual(_run_main(), 0)
         
         # Verify API key was passed from command line argument
         mock_cli.run.assert_called_once()
-        call_args = mock_cli.run.call_args
-        self.assertEqual(call_args[1]['api_key'], 'sk-test123')
+        self.assertEqual(mock_cli.run.call_args[1]['api_key'], 'sk-test123')
     
     @patch('main.VideoTranscriberCLI')
     @patch('sys.argv', ['main.py', 'test.mp4'])
-    @patch.dict('os.environ', {'OPENAI_API_KEY': 'sk-env123'})
     def test_main_api_key_from_env(self, mock_cli_class):
         """Test main function with API key from environment."""
-        mock_cli = MagicMock()
-        mock_cli.run.return_value = {"success": True}
-        
-        # Mock parse_arguments to return expected values
-        mock_args = MagicMock()
-        mock_args.video_path = 'test.mp4'
-        mock_args.output_dir = 'output'
-        mock_args.api_key = None  # From args
-        mock_args.language = 'en-US'
-        mock_cli.parse_arguments.return_value = mock_args
+        os.environ['OPENAI_API_KEY'] = 'sk-env123'  # Restored in tearDown
+        mock_cli = self._configure_cli(mock_cli_class)
         
-        mock_cli_class.return_value = mock_cli
-        
-        with self.assertRaises(SystemExit):
-            main()
+        self.assertEqual(_run_main(), 0)
         
         # Verify API key was taken from environment
         mock_cli.run.assert_called_once()
-        call_args = mock_cli.run.call_args
-        self.assertEqual(call_args[1]['api_key'], 'sk-env123')
+        self.assertEqual(mock_cli.run.call_args[1]['api_key'], 'sk-env123')
 
 
 class TestArgumentParsing(unittest.TestCase):
     """Test cases for command line argument parsing."""
     
-    def setUp(self):
-        """Set up CLI instance for testing."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up CLI instance for testing; argument parsing keeps no state."""
         with patch.multiple(
             'main',
             Config=MagicMock,
@@ -437,7 +344,7 @@ class TestArgumentParsing(unittest.TestCase):
             Transcriber=MagicMock,
             Summarizer=MagicMock
         ):
-            self.cli = VideoTranscriberCLI()
+            cls.cli = VideoTranscriberCLI()
     
     @patch('sys.argv', ['main.py', 'test.mp4'])
     def test_parse_minimal_args(self):
@@ -472,6 +379,29 @@ class TestArgumentParsing(unittest.TestCase):
         self.assertEqual(args.language, 'de-DE')
         self.assertTrue(args.verbose)
 
+    
+    def test_parser_built_once(self):
+        """Test that the argument parser is reused across calls."""
+        with patch.multiple(
+            'main',
+            Config=MagicMock,
+            FileHandler=MagicMock,
+            AudioExtractor=MagicMock,
+            Transcriber=MagicMock,
+            Summarizer=MagicMock
+        ):
+            cli = VideoTranscriberCLI()
+        
+        with patch.object(cli, '_build_parser', wraps=cli._build_parser) as mock_build:
+            with patch('sys.argv', ['main.py', 'first.mp4']):
+                first = cli.parse_arguments()
+            with patch('sys.argv', ['main.py', 'second.mp4']):
+                second = cli.parse_arguments()
+        
+        self.assertEqual(first.video_path, 'first.mp4')
+        self.assertEqual(second.video_path, 'second.mp4')
+        mock_build.assert_called_once()
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -2,28 +2,40 @@
 
 import os
 import tempfile
+import threading
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, mock_open, MagicMock
 from pathlib import Path
 
-from src.utils.config import Config, get_config
+from src.utils.config import Config, get_config, DOTENV_AVAILABLE
 
 
 class TestConfig(unittest.TestCase):
     """Test cases for Config utility."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create the shared temporary directory for config files."""
+        cls._temp_dir_ctx = tempfile.TemporaryDirectory()
+        cls.temp_dir = cls._temp_dir_ctx.name
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared temporary directory."""
+        cls._temp_dir_ctx.cleanup()
+    
     def setUp(self):
         """Set up test fixtures."""
-        # Create temporary directory for config files
-        self.temp_dir = tempfile.mkdtemp()
-        self.temp_config_file = os.path.join(self.temp_dir, "test_config.txt")
+        # Each test writes to its own config file in the shared directory
+        self.temp_config_file = os.path.join(self.temp_dir, f"config_{self._testMethodName}.txt")
     
     def tearDown(self):
         """Clean up test fixtures."""
         # Clean up temporary files
         if os.path.exists(self.temp_config_file):
             os.remove(self.temp_config_file)
-        os.rmdir(self.temp_dir)
         
         # Reset global config instance
         import src.utils.config
@@ -59,6 +71,16 @@ class TestConfig(unittest.TestCase):
         config = Config(self.temp_config_file)
         self.assertEqual(config.get_output_directory(), '/custom/output')
     
+    @patch.dict(os.environ, {'CHATGPT_API_KEY': 'sk-test-key-123'})
+    def test_env_snapshot_stable_after_mutation(self):
+        """Test that environment variables are resolved once at initialization."""
+        config = Config(self.temp_config_file)
+        
+        os.environ['CHATGPT_API_KEY'] = 'sk-changed-key-456'
+        
+        self.assertEqual(config.get_chatgpt_api_key(), 'sk-test-key-123')
+        self.assertEqual(Config(self.temp_config_file).get_chatgpt_api_key(), 'sk-changed-key-456')
+    
     def test_load_config_from_file(self):
         """Test loading configuration from file."""
         # Create test config file
@@ -129,24 +151,68 @@ class TestConfig(unittest.TestCase):
             content = f.read()
             self.assertIn('chatgpt_api_key=sk-test-save-key', content)
     
+    def test_save_config_single_write(self):
+        """Test that save_config writes the whole file in one call."""
+        config = Config(self.temp_config_file)
+        
+        with patch('src.utils.config.open', mock_open(), create=True) as mocked_open:
+            config.set_chatgpt_api_key('sk-test-save-key')
+        
+        handle = mocked_open()
+        handle.write.assert_called_once()
+        self.assertIn('chatgpt_api_key=sk-test-save-key\n', handle.write.call_args[0][0])
+    
     def test_validate_api_key_valid(self):
         """Test validate_api_key returns True for valid API key."""
-        config = Config(self.temp_config_file)
-        config.set_chatgpt_api_key('sk-valid-key-with-sufficient-length')
+        config = Config(initial={'chatgpt_api_key': 'sk-valid-key-with-sufficient-length'})
         self.assertTrue(config.validate_api_key())
     
     def test_validate_api_key_invalid_format(self):
         """Test validate_api_key returns False for invalid format."""
-        config = Config(self.temp_config_file)
-        config.set_chatgpt_api_key('invalid-key-format')
+        config = Config(initial={'chatgpt_api_key': 'invalid-key-format'})
         self.assertFalse(config.validate_api_key())
     
     def test_validate_api_key_too_short(self):
         """Test validate_api_key returns False for too short key."""
-        config = Config(self.temp_config_file)
-        config.set_chatgpt_api_key('sk-short')
+        config = Config(initial={'chatgpt_api_key': 'sk-short'})
         self.assertFalse(config.validate_api_key())
     
+    def test_initial_config_stays_in_memory(self):
+        """Test that a Config built from initial values never touches the disk."""
+        with patch('src.utils.config.open', create=True) as mock_file:
+            config = Config(initial={'output_directory': '/memory/output'})
+            config.set_output_directory('/memory/changed')
+        
+        self.assertIsNone(config.config_file)
+        self.assertEqual(config.get_output_directory(), '/memory/changed')
+        mock_file.assert_not_called()
+    
+    @unittest.skipUnless(DOTENV_AVAILABLE, "python-dotenv is not installed")
+    @patch.dict(os.environ, {}, clear=True)
+    def test_initial_config_ignores_dotenv(self):
+        """Test that an in-memory Config does not load keys from a .env file."""
+        self._write_dotenv("OPENAI_API_KEY=sk-dotenv-test-key\n")
+        
+        with patch('src.utils.config.Path.cwd', return_value=Path(self.temp_dir)):
+            config = Config(initial={'output_directory': '/memory/output'})
+        
+        self.assertIsNone(config.get_chatgpt_api_key())
+        self.assertNotIn('OPENAI_API_KEY', os.environ)
+    
+    def test_initial_config_merges_over_file(self):
+        """Test that initial values layer over an existing file without losing its keys."""
+        with open(self.temp_config_file, 'w', encoding='utf-8') as f:
+            f.write("chatgpt_api_key=sk-file-key-1234567890\ncustom=42\noutput_directory=/file/output\n")
+        
+        config = Config(self.temp_config_file, initial={'output_directory': '/initial/output'})
+        self.assertEqual(config.get_output_directory(), '/initial/output')
+        config.set_output_directory('/changed/output')
+        
+        reloaded = Config(self.temp_config_file)
+        self.assertEqual(reloaded.get_chatgpt_api_key(), 'sk-file-key-1234567890')
+        self.assertEqual(reloaded.get_config('custom'), '42')
+        self.assertEqual(reloaded.get_output_directory(), '/changed/output')
+    
     @patch.dict(os.environ, {}, clear=True)  # Clear all environment variables
     @patch('src.utils.config.DOTENV_AVAILABLE', False)  # Disable .env loading
     def test_validate_api_key_none(self):
@@ -176,29 +242,67 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(config.get_chatgpt_api_key(), 'sk-valid-key')
         self.assertEqual(config.get_output_directory(), '/test/output')
     
-    @patch('src.utils.config.DOTENV_AVAILABLE', True)
-    @patch('src.utils.config.load_dotenv')
-    @patch('src.utils.config.Path')
-    def test_load_dotenv_file_found(self, mock_path_class, mock_load_dotenv):
-        """Test loading .env file when it exists."""
-        # Mock Path.cwd() and Path.exists()
-        mock_cwd = MagicMock()
-        mock_cwd.__truediv__ = MagicMock(return_value=mock_cwd)
-        mock_cwd.exists.return_value = True
-        mock_path_class.cwd.return_value = mock_cwd
-        
-        # Mock other paths to return False
-        mock_other_path = MagicMock()
-        mock_other_path.exists.return_value = False
-        mock_path_class.return_value = mock_other_path
-        
-        # Create config which should trigger .env loading
+    def test_load_config_giant(self):
+        """Test loading a config file with many entries, comments and blank lines."""
+        with open(self.temp_config_file, 'w', encoding='utf-8') as f:
+            f.write("# Generated configuration\n\n")
+            for i in range(10000):
+                f.write(f"key_{i} = value={i}\n")
+            f.write("#commented_key=ignored\n")
+        
         config = Config(self.temp_config_file)
         
-        # Verify load_dotenv was called
-        mock_load_dotenv.assert_called_once()
-        call_args = mock_load_dotenv.call_args
-        self.assertEqual(call_args.kwargs['override'], False)
+        self.assertEqual(config.get_config('key_0'), 'value=0')
+        self.assertEqual(config.get_config('key_9999'), 'value=9999')
+        self.assertIsNone(config.get_config('#commented_key'))
+    
+    def test_config_cache_invalidates_on_mtime_change(self):
+        """Test that a rewritten config file is re-parsed instead of served from cache."""
+        with open(self.temp_config_file, 'w') as f:
+            f.write("output_directory=/first/output\n")
+        os.utime(self.temp_config_file, ns=(1_000_000_000, 1_000_000_000))
+        self.assertEqual(Config(self.temp_config_file).get_output_directory(), '/first/output')
+        
+        # Same size, different content and modification time
+        with open(self.temp_config_file, 'w') as f:
+            f.write("output_directory=/other/output\n")
+        os.utime(self.temp_config_file, ns=(2_000_000_000, 2_000_000_000))
+        self.assertEqual(Config(self.temp_config_file).get_output_directory(), '/other/output')
+    
+    def test_save_config_clears_parse_cache(self):
+        """Test that saving re-parses on the next load even if size and mtime are unchanged."""
+        writer = Config(self.temp_config_file)
+        writer.set_output_directory('/first/output')
+        os.utime(self.temp_config_file, ns=(1_000_000_000, 1_000_000_000))
+        self.assertEqual(Config(self.temp_config_file).get_output_directory(), '/first/output')
+        
+        # Same size and, as within one coarse timestamp tick, the same mtime
+        writer.set_output_directory('/other/output')
+        os.utime(self.temp_config_file, ns=(1_000_000_000, 1_000_000_000))
+        self.assertEqual(Config(self.temp_config_file).get_output_directory(), '/other/output')
+    
+    def _write_dotenv(self, content: str) -> None:
+        """Write a .env file into the temp directory, removed after the test.
+        
+        Args:
+            content: Contents of the .env file
+        """
+        dotenv_path = os.path.join(self.temp_dir, ".env")
+        with open(dotenv_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        self.addCleanup(os.remove, dotenv_path)
+    
+    @unittest.skipUnless(DOTENV_AVAILABLE, "python-dotenv is not installed")
+    @patch.dict(os.environ, {'OPENAI_API_KEY': 'sk-existing-key'}, clear=True)
+    def test_load_dotenv_file_found(self):
+        """Test loading .env file when it exists does not override existing variables."""
+        self._write_dotenv("OPENAI_API_KEY=sk-dotenv-key\nTRANSCRIBER_OUTPUT_DIR=/dotenv/output\n")
+        
+        with patch('src.utils.config.Path.cwd', return_value=Path(self.temp_dir)):
+            config = Config(self.temp_config_file)
+        
+        self.assertEqual(config.get_chatgpt_api_key(), 'sk-existing-key')
+        self.assertEqual(config.get_output_directory(), '/dotenv/output')
     
     @patch('src.utils.config.DOTENV_AVAILABLE', True)
     @patch('src.utils.config.load_dotenv')
@@ -242,29 +346,17 @@ class TestConfig(unittest.TestCase):
         call_args = mock_load_dotenv.call_args
         self.assertIn('parent', str(call_args[0][0]))
     
+    @unittest.skipUnless(DOTENV_AVAILABLE, "python-dotenv is not installed")
     @patch.dict(os.environ, {}, clear=True)  # Clear environment
-    @patch('src.utils.config.DOTENV_AVAILABLE', True)
-    @patch('src.utils.config.load_dotenv')
-    @patch('src.utils.config.Path.exists')
-    def test_dotenv_loads_api_key(self, mock_exists, mock_load_dotenv):
+    def test_dotenv_loads_api_key(self):
         """Test that API key from .env file is accessible."""
-        # Mock .env file exists
-        mock_exists.return_value = True
-        
-        # Mock load_dotenv to set environment variable
-        def mock_load_dotenv_func(*args, **kwargs):
-            os.environ['OPENAI_API_KEY'] = 'sk-dotenv-test-key'
+        self._write_dotenv("OPENAI_API_KEY=sk-dotenv-test-key\n")
         
-        mock_load_dotenv.side_effect = mock_load_dotenv_func
-        
-        # Create config
-        config = Config(self.temp_config_file)
+        with patch('src.utils.config.Path.cwd', return_value=Path(self.temp_dir)):
+            config = Config(self.temp_config_file)
         
         # Verify API key was loaded from .env
         self.assertEqual(config.get_chatgpt_api_key(), 'sk-dotenv-test-key')
-        
-        # Clean up
-        os.environ.pop('OPENAI_API_KEY', None)
 
 
 class TestGetConfig(unittest.TestCase):
@@ -281,6 +373,25 @@ class TestGetConfig(unittest.TestCase):
         config2 = get_config()
         self.assertIs(config1, config2)
     
+    def test_get_config_concurrent_first_call(self):
+        """Test that concurrent first calls to get_config share one instance."""
+        barrier = threading.Barrier(8)
+        
+        def slow_config():
+            time.sleep(0.01)  # Widen the window between the check and the assignment
+            return MagicMock(spec=Config)
+        
+        def call_get_config():
+            barrier.wait()
+            return get_config()
+        
+        with patch('src.utils.config.Config', side_effect=slow_config) as mock_config_class:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(lambda _: call_get_config(), range(8)))
+        
+        self.assertEqual(mock_config_class.call_count, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+    
     def test_get_config_returns_config_instance(self):
         """Test that get_config returns a Config instance."""
         config = get_config()
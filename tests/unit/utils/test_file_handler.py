@@ -1,28 +1,38 @@
 """Unit tests for FileHandler utility."""
 
+import errno
+import fnmatch
 import os
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
+from conftest import ram_backed_temp_dir
 from src.utils.file_handler import FileHandler
 
 
 class TestFileHandler(unittest.TestCase):
     """Test cases for FileHandler utility."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Create one root temp directory, RAM-backed where available."""
+        cls._temp_root_ctx = ram_backed_temp_dir()
+        cls.test_content = "This is test content."
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the root temp directory and every per-test directory in it."""
+        cls._temp_root_ctx.cleanup()
+    
     def setUp(self):
         """Set up test fixtures."""
-        # Create temporary directory for tests
-        self.temp_dir = tempfile.mkdtemp()
+        # Each test gets its own directory; all are removed together in tearDownClass
+        self.temp_dir = tempfile.mkdtemp(dir=self._temp_root_ctx.name)
         self.test_file = os.path.join(self.temp_dir, "test_file.txt")
-        self.test_content = "This is test content."
-    
-    def tearDown(self):
-        """Clean up test fixtures."""
-        # Clean up temporary directory
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self.copied_file = os.path.join(self.temp_dir, "copied_file.txt")
+        self.nonexistent_file = os.path.join(self.temp_dir, "nonexistent.txt")
     
     def test_ensure_directory_exists_creates_new(self):
         """Test ensure_directory_exists creates new directory."""
@@ -64,9 +74,7 @@ class TestFileHandler(unittest.TestCase):
     
     def test_read_text_file_nonexistent(self):
         """Test read_text_file with non-existent file."""
-        nonexistent_file = os.path.join(self.temp_dir, "nonexistent.txt")
-        
-        result = FileHandler.read_text_file(nonexistent_file)
+        result = FileHandler.read_text_file(self.nonexistent_file)
         
         self.assertIsNone(result)
     
@@ -82,6 +90,34 @@ class TestFileHandler(unittest.TestCase):
         
         self.assertEqual(result, content)
     
+    def test_read_text_file_invalid_encoding(self):
+        """Test read_text_file returns None when the content cannot be decoded."""
+        with open(self.test_file, 'wb') as f:
+            f.write(b"\xff\xfe invalid utf-8 \xc3")
+        
+        result = FileHandler.read_text_file(self.test_file)
+        
+        self.assertIsNone(result)
+    
+    def test_read_text_file_translates_newlines(self):
+        """Test read_text_file normalizes Windows and old Mac line endings."""
+        with open(self.test_file, 'wb') as f:
+            f.write(b"line one\r\nline two\rline three\n")
+        
+        result = FileHandler.read_text_file(self.test_file)
+        
+        self.assertEqual(result, "line one\nline two\nline three\n")
+    
+    def test_read_text_file_large(self):
+        """Test read_text_file returns a multi-megabyte file intact."""
+        content = "0123456789abcdef" * (4 * 1024 * 1024 // 16)
+        with open(self.test_file, 'w', encoding='utf-8') as f:
+            f.write(content)
+        
+        result = FileHandler.read_text_file(self.test_file)
+        
+        self.assertEqual(result, content)
+    
     def test_write_text_file_new(self):
         """Test write_text_file creates new file."""
         result = FileHandler.write_text_file(self.test_file, self.test_content)
@@ -160,19 +196,58 @@ class TestFileHandler(unittest.TestCase):
         with open(self.test_file, 'w', encoding='utf-8') as f:
             f.write(self.test_content)
         
-        destination = os.path.join(self.temp_dir, "copied_file.txt")
-        result = FileHandler.copy_file(self.test_file, destination)
+        result = FileHandler.copy_file(self.test_file, self.copied_file)
         
         self.assertTrue(result)
-        self.assertTrue(os.path.exists(destination))
+        self.assertTrue(os.path.exists(self.copied_file))
         
         # Verify both files exist with same content
         self.assertTrue(os.path.exists(self.test_file))
-        with open(destination, 'r', encoding='utf-8') as f:
+        with open(self.copied_file, 'r', encoding='utf-8') as f:
             copied_content = f.read()
         
         self.assertEqual(copied_content, self.test_content)
     
+    def test_copy_file_large(self):
+        """Test copy_file copies a multi-megabyte file intact with its metadata."""
+        payload = os.urandom(4 * 1024 * 1024)
+        with open(self.test_file, 'wb') as f:
+            f.write(payload)
+        os.utime(self.test_file, ns=(1_000_000_000, 1_000_000_000))
+        
+        destination = os.path.join(self.temp_dir, "copied_large.bin")
+        result = FileHandler.copy_file(self.test_file, destination)
+        
+        self.assertTrue(result)
+        with open(destination, 'rb') as f:
+            self.assertEqual(f.read(), payload)
+        self.assertEqual(os.stat(destination).st_mtime_ns, 1_000_000_000)
+    
+    def test_copy_file_overwrites_same_size_and_mtime(self):
+        """Test copy_file replaces a destination that only matches size and mtime."""
+        with open(self.test_file, 'w', encoding='utf-8') as f:
+            f.write(self.test_content)
+        stale_content = self.test_content.upper()
+        with open(self.copied_file, 'w', encoding='utf-8') as f:
+            f.write(stale_content)
+        
+        # Same size and modification time as the source, e.g. after cp -p
+        source_stat = os.stat(self.test_file)
+        os.utime(self.copied_file, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+        
+        self.assertTrue(FileHandler.copy_file(self.test_file, self.copied_file))
+        with open(self.copied_file, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), self.test_content)
+    
+    def test_copy_file_onto_itself(self):
+        """Test copy_file reports failure when source and destination are the same file."""
+        with open(self.test_file, 'w', encoding='utf-8') as f:
+            f.write(self.test_content)
+        
+        self.assertFalse(FileHandler.copy_file(self.test_file, self.test_file))
+        with open(self.test_file, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), self.test_content)
+    
     def test_copy_file_creates_directory(self):
         """Test copy_file creates destination directory."""
         # Create source file
@@ -188,10 +263,9 @@ class TestFileHandler(unittest.TestCase):
     
     def test_copy_file_nonexistent_source(self):
         """Test copy_file with non-existent source file."""
-        nonexistent_source = os.path.join(self.temp_dir, "nonexistent.txt")
         destination = os.path.join(self.temp_dir, "destination.txt")
         
-        result = FileHandler.copy_file(nonexistent_source, destination)
+        result = FileHandler.copy_file(self.nonexistent_file, destination)
         
         self.assertFalse(result)
         self.assertFalse(os.path.exists(destination))
@@ -229,6 +303,35 @@ class TestFileHandler(unittest.TestCase):
         self.assertTrue(os.path.exists(os.path.dirname(destination)))
         self.assertFalse(os.path.exists(self.test_file))
     
+    def test_move_file_same_fs_is_rename(self):
+        """Test move_file renames in place without copying on the same filesystem."""
+        with open(self.test_file, 'w', encoding='utf-8') as f:
+            f.write(self.test_content)
+        destination = os.path.join(self.temp_dir, "moved_file.txt")
+        
+        with patch('src.utils.file_handler.shutil.copyfile') as mock_copyfile:
+            result = FileHandler.move_file(self.test_file, destination)
+        
+        self.assertTrue(result)
+        mock_copyfile.assert_not_called()
+        self.assertFalse(os.path.exists(self.test_file))
+        with open(destination, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), self.test_content)
+    
+    def test_move_file_cross_device_falls_back(self):
+        """Test move_file falls back to shutil.move when rename crosses filesystems."""
+        with open(self.test_file, 'w', encoding='utf-8') as f:
+            f.write(self.test_content)
+        destination = os.path.join(self.temp_dir, "moved_file.txt")
+        cross_device = OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+        
+        with patch('src.utils.file_handler.os.replace', side_effect=cross_device), \
+             patch('src.utils.file_handler.shutil.move') as mock_move:
+            result = FileHandler.move_file(self.test_file, destination)
+        
+        self.assertTrue(result)
+        mock_move.assert_called_once_with(self.test_file, destination)
+    
     def test_delete_file_existing(self):
         """Test delete_file removes existing file."""
         # Create test file
@@ -244,9 +347,7 @@ class TestFileHandler(unittest.TestCase):
     
     def test_delete_file_nonexistent(self):
         """Test delete_file with non-existent file."""
-        nonexistent_file = os.path.join(self.temp_dir, "nonexistent.txt")
-        
-        result = FileHandler.delete_file(nonexistent_file)
+        result = FileHandler.delete_file(self.nonexistent_file)
         
         self.assertTrue(result)  # Should still return True
     
@@ -290,9 +391,7 @@ class TestFileHandler(unittest.TestCase):
     
     def test_get_file_size_nonexistent(self):
         """Test get_file_size returns None for non-existent file."""
-        nonexistent_file = os.path.join(self.temp_dir, "nonexistent.txt")
-        
-        result = FileHandler.get_file_size(nonexistent_file)
+        result = FileHandler.get_file_size(self.nonexistent_file)
         
         self.assertIsNone(result)
     
@@ -331,6 +430,55 @@ class TestFileHandler(unittest.TestCase):
         self.assertIn(txt_file, result)
         self.assertNotIn(py_file, result)
     
+    def test_list_files_scandir_no_extra_stat(self):
+        """Test list_files does not stat each entry for single-directory patterns."""
+        file1 = os.path.join(self.temp_dir, "file1.txt")
+        with open(file1, 'w') as f:
+            f.write("content1")
+        
+        with patch('os.stat', side_effect=AssertionError("unexpected stat")) as mock_stat:
+            result = FileHandler.list_files(self.temp_dir, "*.txt")
+        
+        self.assertEqual(result, [file1])
+        mock_stat.assert_not_called()
+    
+    def test_list_files_pattern_compiled_once(self):
+        """Test list_files translates the pattern once regardless of entry count."""
+        for name in ("a.txt", "b.txt", "c.txt", "d.py"):
+            with open(os.path.join(self.temp_dir, name), 'w'):
+                pass
+        
+        with patch('src.utils.file_handler.fnmatch.translate', wraps=fnmatch.translate) as mock_translate:
+            result = FileHandler.list_files(self.temp_dir, "*.txt")
+        
+        self.assertEqual(len(result), 3)
+        mock_translate.assert_called_once_with("*.txt")
+    
+    def test_list_files_recursive_pattern(self):
+        """Test list_files still supports recursive glob patterns."""
+        nested_dir = os.path.join(self.temp_dir, "subdir")
+        os.makedirs(nested_dir)
+        nested_file = os.path.join(nested_dir, "nested.txt")
+        with open(nested_file, 'w') as f:
+            f.write("content")
+        
+        result = FileHandler.list_files(self.temp_dir, "**/*.txt")
+        
+        self.assertIn(nested_file, result)
+    
+    def test_list_files_same_format_for_both_branches(self):
+        """Test list_files returns identical paths from the scandir and glob branches."""
+        for name in ("b.txt", "a.txt"):
+            with open(os.path.join(self.temp_dir, name), 'w') as f:
+                f.write("content")
+        
+        flat = FileHandler.list_files(self.temp_dir + os.sep, "*.txt")
+        recursive = FileHandler.list_files(self.temp_dir, "**/*.txt")
+        
+        self.assertEqual(flat, recursive)
+        self.assertEqual(flat, [os.path.join(self.temp_dir, "a.txt"),
+                                os.path.join(self.temp_dir, "b.txt")])
+    
     def test_list_files_nonexistent_directory(self):
         """Test list_files returns empty list for non-existent directory."""
         nonexistent_dir = os.path.join(self.temp_dir, "nonexistent")
@@ -391,6 +539,32 @@ class TestFileHandler(unittest.TestCase):
         self.assertEqual(result, expected)
         self.assertFalse(os.path.exists(result))
     
+    def test_create_unique_filename_many_existing(self):
+        """Test create_unique_filename skips a run of existing files with few existence checks."""
+        base_name = os.path.join(self.temp_dir, "many.txt")
+        for name in ["many.txt"] + [f"many_{i}.txt" for i in range(1, 21)]:
+            with open(os.path.join(self.temp_dir, name), 'w') as f:
+                f.write("content")
+        
+        with patch('src.utils.file_handler.os.path.exists', wraps=os.path.exists) as mock_exists:
+            result = FileHandler.create_unique_filename(base_name)
+        
+        self.assertEqual(result, os.path.join(self.temp_dir, "many_21.txt"))
+        # The base name and the free candidate; taken numbers come from one listing
+        self.assertEqual(mock_exists.call_count, 2)
+    
+    def test_create_unique_filename_with_gap(self):
+        """Test create_unique_filename returns the lowest free number when the numbering has gaps."""
+        base_name = os.path.join(self.temp_dir, "gap.txt")
+        existing = ["gap.txt", "gap_1.txt", "gap_2.txt", "gap_4.txt"]
+        for name in existing:
+            with open(os.path.join(self.temp_dir, name), 'w') as f:
+                f.write("content")
+        
+        result = FileHandler.create_unique_filename(base_name)
+        
+        self.assertEqual(result, os.path.join(self.temp_dir, "gap_3.txt"))
+    
     def test_is_file_writable_existing_writable(self):
         """Test is_file_writable returns True for writable existing file."""
         with open(self.test_file, 'w') as f:
@@ -3,11 +3,12 @@ Unit tests for the validators utility module.
 """
 
 import unittest
-import tempfile
 import os
+import stat
 from pathlib import Path
 from unittest.mock import patch, mock_open
 
+from conftest import ram_backed_temp_dir
 from src.utils.validators import (
     ValidationError,
     validate_file_exists,
@@ -20,35 +21,41 @@ from src.utils.validators import (
 )
 
 
+# A path longer than 260 characters (Windows limit)
+_LONG_PATH = "C:\\" + "very_long_directory_name_" * 20 + "file.mp4"
+
+
 class TestValidators(unittest.TestCase):
     """Test cases for the validators module."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        # Create temporary directory for test files
-        self.temp_dir = tempfile.mkdtemp()
-        
-        # Create test files
-        self.valid_mp4_file = os.path.join(self.temp_dir, "test_video.mp4")
-        self.invalid_format_file = os.path.join(self.temp_dir, "test_video.avi")
-        self.empty_file = os.path.join(self.temp_dir, "empty.mp4")
-        
-        # Create valid MP4 file with some content
-        with open(self.valid_mp4_file, 'wb') as f:
-            f.write(b"fake mp4 content for testing")
-        
-        # Create file with invalid format
-        with open(self.invalid_format_file, 'wb') as f:
-            f.write(b"fake avi content")
-        
-        # Create empty file
-        with open(self.empty_file, 'wb') as f:
-            pass  # Empty file
+    @classmethod
+    def setUpClass(cls):
+        """Create the read-only test files once for the whole class, RAM-backed where available."""
+        cls._temp_dir_ctx = ram_backed_temp_dir()
+        cls.temp_dir = cls._temp_dir_ctx.name
+        
+        cls.valid_mp4_file = os.path.join(cls.temp_dir, "test_video.mp4")
+        cls.invalid_format_file = os.path.join(cls.temp_dir, "test_video.avi")
+        cls.empty_file = os.path.join(cls.temp_dir, "empty.mp4")
+        cls.nonexistent_file = os.path.join(cls.temp_dir, "nonexistent.mp4")  # Never created
+        cls.upper_case_file = os.path.join(cls.temp_dir, "test.MP4")
+        cls.mixed_case_file = os.path.join(cls.temp_dir, "test.Mp4")
+        
+        test_files = [
+            (cls.valid_mp4_file, b"fake mp4 content for testing"),
+            (cls.invalid_format_file, b"fake avi content"),  # Invalid format
+            (cls.empty_file, b""),  # Empty file
+            # Uppercase and mixed case extensions
+            (cls.upper_case_file, b"test content"),
+            (cls.mixed_case_file, b"test content"),
+        ]
+        for path, content in test_files:
+            Path(path).write_bytes(content)
     
-    def tearDown(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir)
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared temporary directory."""
+        cls._temp_dir_ctx.cleanup()
     
     def test_validate_file_exists_success(self):
         """Test successful file existence validation."""
@@ -60,10 +67,8 @@ class TestValidators(unittest.TestCase):
     
     def test_validate_file_exists_nonexistent(self):
         """Test validation failure for non-existent file."""
-        nonexistent_file = os.path.join(self.temp_dir, "nonexistent.mp4")
-        
         with self.assertRaises(ValidationError) as context:
-            validate_file_exists(nonexistent_file)
+            validate_file_exists(self.nonexistent_file)
         
         self.assertIn("File does not exist", str(context.exception))
     
@@ -118,8 +123,7 @@ class TestValidators(unittest.TestCase):
     
     def test_validate_video_file_nonexistent(self):
         """Test video file validation with non-existent file."""
-        nonexistent = os.path.join(self.temp_dir, "nonexistent.mp4")
-        is_valid, error_msg = validate_video_file(nonexistent)
+        is_valid, error_msg = validate_video_file(self.nonexistent_file)
         
         self.assertFalse(is_valid)
         self.assertIn("File does not exist", error_msg)
@@ -138,23 +142,36 @@ class TestValidators(unittest.TestCase):
         self.assertFalse(is_valid)
         self.assertIn("File is empty", error_msg)
     
-    @patch('builtins.open', side_effect=PermissionError("Access denied"))
-    def test_validate_video_file_not_readable(self, mock_file):
-        """Test video file validation with unreadable file."""
+    @patch('src.utils.validators.open', create=True, side_effect=PermissionError("Access denied"))
+    def test_validate_video_file_not_readable_mocked(self, mock_file):
+        """Test video file validation when opening the file is denied."""
         is_valid, error_msg = validate_video_file(self.valid_mp4_file)
         
         self.assertFalse(is_valid)
         self.assertIn("File is not readable", error_msg)
     
+    @unittest.skipIf(not hasattr(os, 'geteuid') or os.geteuid() == 0,
+                     "needs POSIX permissions and a non-root user")
+    def test_validate_video_file_not_readable(self):
+        """Test video file validation with unreadable file."""
+        unreadable_file = os.path.join(self.temp_dir, "unreadable.mp4")
+        Path(unreadable_file).write_bytes(b"unreadable content")
+        os.chmod(unreadable_file, 0)
+        self.addCleanup(os.remove, unreadable_file)
+        
+        is_valid, error_msg = validate_video_file(unreadable_file)
+        
+        self.assertFalse(is_valid)
+        self.assertIn("File is not readable", error_msg)
+    
     def test_validate_output_directory_success(self):
         """Test successful output directory validation."""
         output_dir = os.path.join(self.temp_dir, "output")
         
         try:
             validate_output_directory(output_dir)
-            # Verify directory was created
-            self.assertTrue(os.path.exists(output_dir))
-            self.assertTrue(os.path.isdir(output_dir))
+            # Verify directory was created (os.stat raises if it is missing)
+            self.assertTrue(stat.S_ISDIR(os.stat(output_dir).st_mode))
         except ValidationError:
             self.fail("validate_output_directory failed for valid directory")
     
@@ -194,10 +211,9 @@ class TestValidators(unittest.TestCase):
     
     def test_validate_api_key_none(self):
         """Test API key validation with None."""
-        with self.assertRaises(ValidationError) as context:
+        # Same branch as the empty key; the message is checked in test_validate_api_key_empty
+        with self.assertRaises(ValidationError):
             validate_api_key(None)
-        
-        self.assertIn("API key cannot be empty", str(context.exception))
     
     def test_validate_api_key_not_string(self):
         """Test API key validation with non-string input."""
@@ -217,17 +233,19 @@ class TestValidators(unittest.TestCase):
         """Test getting file info for existing file."""
         info = get_file_info(self.valid_mp4_file)
         
-        self.assertTrue(info["exists"])
-        self.assertTrue(info["is_file"])
+        expected = {
+            "exists": True,
+            "is_file": True,
+            "extension": ".mp4",
+            "name": "test_video.mp4",
+            "readable": True,
+        }
+        self.assertEqual({key: info[key] for key in expected}, expected)
         self.assertGreater(info["size"], 0)
-        self.assertEqual(info["extension"], ".mp4")
-        self.assertIn("test_video.mp4", info["name"])
-        self.assertTrue(info["readable"])
     
     def test_get_file_info_nonexistent_file(self):
         """Test getting file info for non-existent file."""
-        nonexistent = os.path.join(self.temp_dir, "nonexistent.mp4")
-        info = get_file_info(nonexistent)
+        info = get_file_info(self.nonexistent_file)
         
         self.assertFalse(info["exists"])
     
@@ -240,42 +258,34 @@ class TestValidators(unittest.TestCase):
     
     def test_is_valid_file_path_success(self):
         """Test valid file path validation."""
-        valid_paths = [
+        valid_paths = (
             "/path/to/file.mp4",
             "relative/path/file.mp4",
             "C:\\Windows\\file.mp4",
             "file.mp4",
             "./file.mp4",
             "../file.mp4"
-        ]
+        )
         
-        for path in valid_paths:
-            with self.subTest(path=path):
-                self.assertTrue(is_valid_file_path(path))
+        # One assertion; the failure message still lists every rejected path
+        rejected = [path for path in valid_paths if not is_valid_file_path(path)]
+        self.assertEqual(rejected, [])
     
     def test_is_valid_file_path_failure(self):
-        """Test invalid file path validation."""
-        invalid_paths = [
-            "",
-            "   ",
-            None  # This should be handled gracefully
-        ]
+        """Test invalid file path validation for empty and whitespace paths."""
+        invalid_paths = ("", "   ")
         
-        for path in invalid_paths:
-            with self.subTest(path=path):
-                if path is None:
-                    # None should cause an exception that's caught
-                    with self.assertRaises(TypeError):
-                        is_valid_file_path(path)
-                else:
-                    self.assertFalse(is_valid_file_path(path))
+        accepted = [path for path in invalid_paths if is_valid_file_path(path)]
+        self.assertEqual(accepted, [])
+    
+    def test_is_valid_file_path_none(self):
+        """Test that a None path raises TypeError."""
+        with self.assertRaises(TypeError):
+            is_valid_file_path(None)
     
     def test_is_valid_file_path_too_long(self):
         """Test file path validation with extremely long path."""
-        # Create a path longer than 260 characters (Windows limit)
-        long_path = "C:\\" + "very_long_directory_name_" * 20 + "file.mp4"
-        
-        self.assertFalse(is_valid_file_path(long_path))
+        self.assertFalse(is_valid_file_path(_LONG_PATH))
     
     def test_validation_error_inheritance(self):
         """Test that ValidationError is properly inherited from Exception."""
@@ -287,18 +297,9 @@ class TestValidators(unittest.TestCase):
     
     def test_case_insensitive_extension_matching(self):
         """Test that file extension matching is case insensitive."""
-        upper_case_file = os.path.join(self.temp_dir, "test.MP4")
-        mixed_case_file = os.path.join(self.temp_dir, "test.Mp4")
-        
-        # Create files with uppercase and mixed case extensions
-        with open(upper_case_file, 'wb') as f:
-            f.write(b"test content")
-        with open(mixed_case_file, 'wb') as f:
-            f.write(b"test content")
-        
         # Both should be valid
-        is_valid1, _ = validate_video_file(upper_case_file)
-        is_valid2, _ = validate_video_file(mixed_case_file)
+        is_valid1, _ = validate_video_file(self.upper_case_file)
+        is_valid2, _ = validate_video_file(self.mixed_case_file)
         
         self.assertTrue(is_valid1)
         self.assertTrue(is_valid2)